@@ -1,8 +1,9 @@
 """Session history management endpoints."""
 
+import asyncio
 from typing import Dict
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 
 from app.schemas.history import HistoryListResponse, SessionHistoryDetail
 from app.services.history_service import history_service
@@ -11,16 +12,21 @@ router = APIRouter()
 
 
 @router.get("/", response_model=HistoryListResponse)
-async def get_history() -> HistoryListResponse:
-    """Get list of all past sessions."""
-    sessions = history_service.get_all_sessions()
-    return HistoryListResponse(sessions=sessions, total=len(sessions))
+async def get_history() -> Response:
+    """Get list of all past sessions.
+
+    The list is serialized straight to JSON bytes by Pydantic, skipping
+    FastAPI's response-model re-validation and encoding pass.
+    """
+    sessions = await asyncio.to_thread(history_service.get_all_sessions)
+    body = HistoryListResponse(sessions=sessions, total=len(sessions))
+    return Response(content=body.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{session_id}", response_model=SessionHistoryDetail)
 async def get_session_detail(session_id: str) -> SessionHistoryDetail:
     """Get full details of a specific session."""
-    session = history_service.get_session_by_id(session_id)
+    session = await asyncio.to_thread(history_service.get_session_by_id, session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     return session
@@ -29,7 +35,7 @@ async def get_session_detail(session_id: str) -> SessionHistoryDetail:
 @router.delete("/{session_id}")
 async def delete_session(session_id: str) -> Dict[str, str]:
     """Delete a session from history."""
-    deleted = history_service.delete_session(session_id)
+    deleted = await asyncio.to_thread(history_service.delete_session, session_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Session not found")
     return {"message": "Session deleted successfully"}
@@ -38,5 +44,5 @@ async def delete_session(session_id: str) -> Dict[str, str]:
 @router.delete("/")
 async def delete_all_history() -> Dict[str, str]:
     """Delete all session history."""
-    deleted_count = history_service.delete_all_sessions()
+    deleted_count = await asyncio.to_thread(history_service.delete_all_sessions)
     return {"message": f"Deleted {deleted_count} sessions successfully"}
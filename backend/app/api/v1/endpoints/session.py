@@ -1,10 +1,17 @@
 """Session management endpoints for speaking practice."""
 
+import asyncio
 import os
 
 from fastapi import APIRouter, File, UploadFile
 
-from app.core.audio import sanitize_filename, save_upload_file, validate_audio_extension
+from app.core.audio import (
+    get_audio_executor,
+    sanitize_filename,
+    save_upload_file,
+    session_dir,
+    validate_audio_extension,
+)
 from app.core.config import settings
 from app.schemas.session import (
     SessionAnalysis,
@@ -42,13 +49,18 @@ async def process_turn(
     session_id: str, audio: UploadFile = DEFAULT_AUDIO_FILE
 ) -> TurnResponse:
     """Process an audio turn in a speaking practice session."""
-    # Validate and sanitize
+    # Validate and sanitize; unknown or ended sessions never reach the disk
+    session_manager.get_active_session(session_id)
     validate_audio_extension(audio.filename)
     safe_filename = sanitize_filename(audio.filename)
 
-    # Save audio file
-    file_path = os.path.join(settings.AUDIO_UPLOAD_DIR, f"{session_id}_{safe_filename}")
-    saved_path = save_upload_file(audio.file, file_path)
+    # Save audio file; conversion runs ffmpeg, so keep it off the event loop
+    upload_dir = session_dir(settings.AUDIO_UPLOAD_DIR, session_id)
+    file_path = os.path.join(upload_dir, safe_filename)
+    loop = asyncio.get_running_loop()
+    saved_path = await loop.run_in_executor(
+        get_audio_executor(), save_upload_file, audio.file, file_path
+    )
 
     # Process
     return await session_manager.process_turn(session_id, saved_path)
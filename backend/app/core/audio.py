@@ -1,14 +1,45 @@
 """Audio processing utilities for file validation, conversion, and cleanup."""
 
-import io
+import contextlib
+import logging
 import os
 import re
-from typing import BinaryIO
+import shutil
+import subprocess
+import tempfile
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import BinaryIO, Optional
 
 from fastapi import HTTPException
-from pydub import AudioSegment
 
-ALLOWED_AUDIO_EXTENSIONS = {".wav", ".mp3", ".m4a", ".ogg", ".webm", ".aac", ".flac"}
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+ALLOWED_AUDIO_EXTENSIONS = frozenset(
+    {".wav", ".mp3", ".m4a", ".ogg", ".webm", ".aac", ".flac"}
+)
+_INVALID_EXTENSION_DETAIL = "Invalid file extension. Allowed: " + ", ".join(
+    sorted(ALLOWED_AUDIO_EXTENSIONS)
+)
+
+# Characters that aren't alphanumeric, dots, underscores, or dashes
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^a-zA-Z0-9._-]")
+
+# Directories already created by ensure_dir, so repeat turns skip the makedirs call
+_known_dirs: set[str] = set()
+
+# Shared pool for blocking audio conversion, created on first use
+_audio_executor: Optional[ThreadPoolExecutor] = None
+
+# Copy uploads to disk in 1 MiB chunks instead of reading them into memory
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Single ffmpeg pass: any input -> 16kHz, Mono, 16-bit PCM WAV
+FFMPEG_WAV_ARGS = ["-ar", "16000", "-ac", "1", "-sample_fmt", "s16", "-f", "wav"]
 
 
 def sanitize_filename(filename: str | None) -> str:
@@ -23,8 +54,9 @@ def sanitize_filename(filename: str | None) -> str:
     filename = filename.replace("\\", "/")
     filename = os.path.basename(filename)
 
-    # Remove characters that aren't alphanumeric, dots, underscores, or dashes
-    filename = re.sub(r"[^a-zA-Z0-9._-]", "_", filename)
+    # Replace unsafe characters; already-safe names skip the substitution
+    if _UNSAFE_FILENAME_CHARS.search(filename):
+        filename = _UNSAFE_FILENAME_CHARS.sub("_", filename)
 
     # Limit length while preserving extension
     if len(filename) > 255:
@@ -39,75 +71,156 @@ def validate_audio_extension(filename: str | None) -> None:
     if not filename:
         raise HTTPException(status_code=400, detail="Missing filename")
 
-    _, ext = os.path.splitext(filename.lower())
-    if ext not in ALLOWED_AUDIO_EXTENSIONS:
-        allowed_extensions = ", ".join(ALLOWED_AUDIO_EXTENSIONS)
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid file extension. Allowed: {allowed_extensions}",
-        )
+    _, dot, ext = filename.lower().rpartition(".")
+    if not dot or f".{ext}" not in ALLOWED_AUDIO_EXTENSIONS:
+        raise HTTPException(status_code=400, detail=_INVALID_EXTENSION_DETAIL)
 
 
-def save_upload_file(upload_file: BinaryIO, destination: str) -> str:
-    """Save and process an uploaded audio file.
+@lru_cache(maxsize=1024)
+def session_dir(base_dir: str, session_id: str) -> str:
+    """Return the per-session subdirectory of base_dir for a session's files.
 
-    Converts to WAV, 16kHz, Mono for optimal ASR.
+    Cached so each turn reuses the sanitized, joined path for its session.
+
+    Raises:
+        ValueError: If the session ID is empty or would name base_dir itself
+            or its parent ("." or "..").
     """
+    name = sanitize_filename(session_id) if session_id else ""
+    if name in ("", ".", ".."):
+        raise ValueError(f"Invalid session ID: {session_id!r}")
+    return os.path.join(base_dir, name)
+
+
+def ensure_dir(path: str) -> str:
+    """Create a directory if it hasn't been created yet and return its path."""
+    if path not in _known_dirs:
+        os.makedirs(path, exist_ok=True)
+        _known_dirs.add(path)
+    return path
+
+
+def get_audio_executor() -> ThreadPoolExecutor:
+    """Return the shared thread pool used for blocking audio conversion."""
+    global _audio_executor
+    if _audio_executor is None:
+        _audio_executor = ThreadPoolExecutor(
+            max_workers=settings.AUDIO_WORKERS, thread_name_prefix="audio"
+        )
+    return _audio_executor
+
+
+def shutdown_audio_executor() -> None:
+    """Shut down the audio thread pool, waiting for running conversions."""
+    global _audio_executor
+    if _audio_executor is not None:
+        _audio_executor.shutdown(wait=True)
+        _audio_executor = None
+
+
+def _is_asr_ready_wav(path: str) -> bool:
+    """Check whether a file is already a 16kHz, Mono, 16-bit PCM WAV."""
     try:
-        # Read the uploaded file content
-        content = upload_file.read()
-        audio_stream = io.BytesIO(content)
+        with wave.open(path, "rb") as wav:
+            return (
+                wav.getframerate() == 16000
+                and wav.getnchannels() == 1
+                and wav.getsampwidth() == 2
+                and wav.getcomptype() == "NONE"
+            )
+    except (wave.Error, EOFError, OSError):
+        return False
+
+
+def _convert_to_wav(source: str, destination: str) -> None:
+    """Decode and resample in one ffmpeg process, without buffering PCM in Python."""
+    subprocess.run(
+        ["ffmpeg", "-nostdin", "-loglevel", "error", "-y", "-i", source]
+        + FFMPEG_WAV_ARGS
+        + [destination],
+        check=True,
+        capture_output=True,
+    )
+
+
+def _save_raw_upload(
+    upload_file: BinaryIO, spooled_path: Optional[str], destination: str
+) -> None:
+    """Store the unconverted upload at destination.
+
+    A fully spooled temp file is renamed into place instead of copying the
+    upload a second time.
+    """
+    if spooled_path is not None:
+        os.replace(spooled_path, destination)
+        return
 
-        # Load audio from stream
-        # Try to detect format or let pydub handle it
-        audio = AudioSegment.from_file(audio_stream)
+    upload_file.seek(0)
+    with open(destination, "wb") as buffer:
+        shutil.copyfileobj(upload_file, buffer, length=UPLOAD_CHUNK_SIZE)
 
-        # Standardize: 16kHz, Mono, 16-bit
-        audio = audio.set_frame_rate(16000).set_channels(1).set_sample_width(2)
 
-        # Ensure destination is .wav
-        base_dest, _ = os.path.splitext(destination)
-        final_dest = f"{base_dest}.wav"
+def save_upload_file(upload_file: BinaryIO, destination: str) -> str:
+    """Save and process an uploaded audio file.
 
-        # Export as wav
-        audio.export(final_dest, format="wav")
+    Streams the upload to a temporary file, then converts it with ffmpeg to
+    WAV, 16kHz, Mono for optimal ASR. Uploads already in that format are
+    moved into place without re-encoding.
+    """
+    _, ext = os.path.splitext(destination.lower())
+    dest_dir = ensure_dir(os.path.dirname(destination))
+    # Ensure destination is .wav
+    base_dest, _ = os.path.splitext(destination)
+    final_dest = f"{base_dest}.wav"
+    tmp_path = None
+    spooled = False
+    try:
+        # Stream the upload to disk so the raw bytes never sit in memory. The
+        # temp file lives next to the destination so it can be renamed in place.
+        with tempfile.NamedTemporaryFile(delete=False, suffix=ext, dir=dest_dir) as tmp:
+            tmp_path = tmp.name
+            shutil.copyfileobj(upload_file, tmp, length=UPLOAD_CHUNK_SIZE)
+        spooled = True
+
+        if ext == ".wav" and _is_asr_ready_wav(tmp_path):
+            os.replace(tmp_path, final_dest)
+            tmp_path = None
+        else:
+            _convert_to_wav(tmp_path, final_dest)
         return final_dest
     except Exception as e:
-        print(f"Error processing audio file: {e}")
+        logger.warning("Error processing audio file, saving raw upload: %s", e)
         # Fallback to simple save if processing fails (might be useful for debugging)
         try:
-            upload_file.seek(0)
-            with open(destination, "wb") as buffer:
-                buffer.write(upload_file.read())
+            # ffmpeg may have left a truncated WAV behind
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(final_dest)
+            _save_raw_upload(upload_file, tmp_path if spooled else None, destination)
+            tmp_path = None if spooled else tmp_path
             return destination
         except OSError as fallback_error:
             raise e from fallback_error
+    finally:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 
 def cleanup_session_files(session_id: str) -> None:
     """Delete all uploaded and generated audio files associated with a session."""
-    from app.core.config import settings
+    _delete_session_dir(session_dir(settings.AUDIO_UPLOAD_DIR, session_id), "upload")
+    _delete_session_dir(session_dir(settings.AUDIO_OUTPUT_DIR, session_id), "output")
 
-    # Sanitize session_id just in case
-    safe_session_id = sanitize_filename(session_id)
 
-    _delete_session_files(settings.AUDIO_UPLOAD_DIR, safe_session_id, "upload")
-    _delete_session_files(settings.AUDIO_OUTPUT_DIR, safe_session_id, "output")
-
-
-def _delete_session_files(directory: str, safe_session_id: str, label: str) -> None:
-    """Remove files for a session from a specific directory."""
-    if not os.path.exists(directory):
+def _delete_session_dir(path: str, label: str) -> None:
+    """Remove a session's subdirectory and everything in it."""
+    _known_dirs.discard(path)
+    if not os.path.isdir(path):
         return
 
-    for filename in os.listdir(directory):
-        if not filename.startswith(safe_session_id):
-            continue
-        file_path = os.path.join(directory, filename)
-        try:
-            os.remove(file_path)
-        except Exception as exc:
-            print(f"Error deleting {label} file {filename}: {exc}")
+    try:
+        shutil.rmtree(path)
+    except Exception as exc:
+        logger.error("Error deleting %s directory %s: %s", label, path, exc)
 
 
 def cleanup_orphaned_files(max_age_hours: int = 2) -> int:
@@ -123,10 +236,6 @@ def cleanup_orphaned_files(max_age_hours: int = 2) -> int:
     Returns:
         Number of files deleted.
     """
-    import time
-
-    from app.core.config import settings
-
     cutoff_time = time.time() - (max_age_hours * 3600)
     deleted_count = 0
 
@@ -134,14 +243,22 @@ def cleanup_orphaned_files(max_age_hours: int = 2) -> int:
         if not os.path.exists(directory):
             continue
 
-        for filename in os.listdir(directory):
-            filepath = os.path.join(directory, filename)
-            try:
-                if os.path.getmtime(filepath) < cutoff_time:
-                    os.remove(filepath)
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.stat(follow_symlinks=False).st_mtime >= cutoff_time:
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        # Stale per-session directory
+                        _known_dirs.discard(entry.path)
+                        shutil.rmtree(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        os.remove(entry.path)
+                    else:
+                        continue
                     deleted_count += 1
-                    print(f"Deleted orphaned file: {filepath}")
-            except Exception as e:
-                print(f"Error deleting orphaned file {filepath}: {e}")
+                    logger.info("Deleted orphaned file: %s", entry.path)
+                except Exception as e:
+                    logger.error("Error deleting orphaned file %s: %s", entry.path, e)
 
     return deleted_count
@@ -1,6 +1,7 @@
 """Application configuration and environment variables."""
 
 import os
+from typing import List, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -16,12 +17,29 @@ class Settings(BaseSettings):
     PROJECT_NAME: str = "Speaking Practice App"
     API_V1_STR: str = "/api/v1"
 
+    # Allowed CORS origins. With the "*" default, credentials are disabled so the
+    # wildcard header is sent as-is instead of echoing each request's origin
+    CORS_ORIGINS: List[str] = ["*"]
+
     # Data Settings
     DATA_DIR: str = os.path.join(BACKEND_APP_DIR, "data")
 
     # Audio Settings
     AUDIO_UPLOAD_DIR: str = os.path.join(DATA_DIR, "uploads")
     AUDIO_OUTPUT_DIR: str = os.path.join(DATA_DIR, "outputs")
+    # Worker threads for upload conversion (each runs one ffmpeg process)
+    AUDIO_WORKERS: int = min(4, os.cpu_count() or 1)
+    # Load the ASR model at startup instead of on the first transcription
+    ASR_PRELOAD: bool = False
+    # Run NeMo ASR inference under bfloat16 autocast on CUDA GPUs that support it
+    ASR_BF16: bool = True
+    # Upper bound on in-memory sessions; the least recently used is evicted
+    MAX_SESSIONS: int = 5000
+    # Set to False when a reverse proxy serves AUDIO_OUTPUT_DIR at /static itself
+    SERVE_STATIC: bool = True
+    # nginx internal location serving AUDIO_OUTPUT_DIR; when set, /static
+    # responses hand the file off with X-Accel-Redirect
+    STATIC_ACCEL_REDIRECT_PREFIX: Optional[str] = None
 
     # LLM Settings - Supports any OpenAI-compatible API
     LLM_BASE_URL: str = os.getenv("LLM_BASE_URL", "https://api.openai.com/v1")
@@ -1,70 +1,94 @@
 """Custom exception classes for the application."""
 
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
 from fastapi import status
 
 
 class AppException(Exception):
-    """Base exception class for application errors."""
-
-    def __init__(
-        self,
-        status_code: int,
-        error_code: str,
-        message: str,
-        detail: Optional[Any] = None,
+    """Base exception class for application errors.
+
+    The HTTP status code, error code, and default message are class data set by
+    each subclass; instances only carry the message and detail.
+    """
+
+    status_code: ClassVar[int] = status.HTTP_500_INTERNAL_SERVER_ERROR
+    error_code: ClassVar[str] = "APP_ERROR"
+    default_message: ClassVar[str] = "Application error"
+
+    # Only the message goes to Exception.__init__ so str(exc) is the message;
+    # pickle and copy rebuild instances through __reduce_ex__, not .args
+    def __init__(  # noqa: B042
+        self, message: Optional[str] = None, detail: Optional[Any] = None
     ):
-        """Initialize AppException with status code, error code, message, and detail.
+        """Initialize AppException with message and detail.
 
         Args:
-            status_code: HTTP status code for the error
-            error_code: Application-specific error code
-            message: Human-readable error message
+            message: Human-readable error message (defaults to the class message)
             detail: Additional error details (optional)
         """
-        self.status_code = status_code
-        self.error_code = error_code
-        self.message = message
+        self.message = self.default_message if message is None else message
         self.detail = detail
-        # Pass all args to base Exception for proper .args tuple and pickle support
-        super().__init__(message, status_code, error_code, detail)
+        super().__init__(self.message)
 
-    def __reduce__(self) -> tuple:
+    def __reduce_ex__(self, protocol: Any) -> tuple:
         """Control how exception is pickled.
 
+        Defined directly so pickle and copy don't go through
+        object.__reduce_ex__'s check for a __reduce__ override.
+
+        Args:
+            protocol: Pickle protocol version (unused)
+
+        Returns:
+            Tuple containing (class, args) for reconstruction
+        """
+        return (self.__class__, (self.message, self.detail))
+
+    def __reduce__(self) -> tuple:
+        """Return the same reconstruction tuple as __reduce_ex__.
+
         Returns:
             Tuple containing (class, args) for reconstruction
         """
-        return (
-            self.__class__,
-            (self.status_code, self.error_code, self.message, self.detail),
-        )
+        return self.__reduce_ex__(2)
 
 
 class SessionError(AppException):
     """Exception raised for session-related errors."""
 
-    def __init__(
-        self,
-        status_code: int = status.HTTP_400_BAD_REQUEST,
-        error_code: str = "SESSION_ERROR",
-        message: str = "Session error occurred",
-        detail: Optional[Any] = None,
-    ):
-        """Initialize SessionError with message and detail.
+    status_code = status.HTTP_400_BAD_REQUEST
+    error_code = "SESSION_ERROR"
+    default_message = "Session error occurred"
+
+
+class SessionNotFoundError(AppException):
+    """Exception raised when a session is not found."""
+
+    status_code = status.HTTP_404_NOT_FOUND
+    error_code = "SESSION_NOT_FOUND"
+    default_message = "Session not found"
+
+    # Built from the session ID alone; __reduce_ex__ rebuilds it the same way
+    def __init__(self, session_id: str):  # noqa: B042
+        """Initialize SessionNotFoundError for the missing session.
 
         Args:
-            status_code: HTTP status code for the error
-            error_code: Application-specific error code
-            message: Human-readable error message
-            detail: Additional error details (optional)
+            session_id: The ID of the session that was not found
         """
-        super().__init__(status_code, error_code, message, detail)
+        self.session_id = session_id
+        super().__init__(f"Session {session_id} not found", {"session_id": session_id})
 
+    def __reduce_ex__(self, protocol: Any) -> tuple:
+        """Control how exception is pickled.
 
-class SessionNotFoundError(AppException):
-    """Exception raised when a session is not found."""
+        Args:
+            protocol: Pickle protocol version (unused)
+
+        Returns:
+            Tuple containing (class, args) for reconstruction
+        """
+        return (self.__class__, (self.session_id,))
 
     @classmethod
     def from_session_id(cls, session_id: str) -> "SessionNotFoundError":
@@ -73,93 +97,36 @@ class SessionNotFoundError(AppException):
         Args:
             session_id: The ID of the session that was not found
         """
-        return cls(
-            status.HTTP_404_NOT_FOUND,
-            "SESSION_NOT_FOUND",
-            f"Session {session_id} not found",
-            {"session_id": session_id},
-        )
+        return cls(session_id)
 
 
 class ASRError(AppException):
     """Exception raised for automatic speech recognition errors."""
 
-    def __init__(
-        self,
-        status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
-        error_code: str = "ASR_ERROR",
-        message: str = "Speech recognition failed",
-        detail: Optional[Any] = None,
-    ):
-        """Initialize ASRError with message and detail.
-
-        Args:
-            status_code: HTTP status code for the error
-            error_code: Application-specific error code
-            message: Human-readable error message
-            detail: Additional error details (optional)
-        """
-        super().__init__(status_code, error_code, message, detail)
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    error_code = "ASR_ERROR"
+    default_message = "Speech recognition failed"
 
 
 class TTSError(AppException):
     """Exception raised for text-to-speech synthesis errors."""
 
-    def __init__(
-        self,
-        status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
-        error_code: str = "TTS_ERROR",
-        message: str = "Speech synthesis failed",
-        detail: Optional[Any] = None,
-    ):
-        """Initialize TTSError with message and detail.
-
-        Args:
-            status_code: HTTP status code for the error
-            error_code: Application-specific error code
-            message: Human-readable error message
-            detail: Additional error details (optional)
-        """
-        super().__init__(status_code, error_code, message, detail)
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    error_code = "TTS_ERROR"
+    default_message = "Speech synthesis failed"
 
 
 class LLMError(AppException):
     """Exception raised for language model processing errors."""
 
-    def __init__(
-        self,
-        status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
-        error_code: str = "LLM_ERROR",
-        message: str = "Language model error",
-        detail: Optional[Any] = None,
-    ):
-        """Initialize LLMError with message and detail.
-
-        Args:
-            status_code: HTTP status code for the error
-            error_code: Application-specific error code
-            message: Human-readable error message
-            detail: Additional error details (optional)
-        """
-        super().__init__(status_code, error_code, message, detail)
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    error_code = "LLM_ERROR"
+    default_message = "Language model error"
 
 
 class ValidationError(AppException):
     """Exception raised for data validation errors."""
 
-    def __init__(
-        self,
-        status_code: int = status.HTTP_422_UNPROCESSABLE_ENTITY,
-        error_code: str = "VALIDATION_ERROR",
-        message: str = "Validation error",
-        detail: Optional[Any] = None,
-    ):
-        """Initialize ValidationError with message and detail.
-
-        Args:
-            status_code: HTTP status code for the error
-            error_code: Application-specific error code
-            message: Human-readable error message
-            detail: Additional error details (optional)
-        """
-        super().__init__(status_code, error_code, message, detail)
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    error_code = "VALIDATION_ERROR"
+    default_message = "Validation error"
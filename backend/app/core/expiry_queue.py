@@ -0,0 +1,158 @@
+"""Session expiry and LRU bookkeeping.
+
+Expiries are kept in a min-heap of (expiry timestamp, session ID). Each entry
+is re-checked against the session's last activity when it comes due, so
+activity never needs to update the heap.
+"""
+
+import asyncio
+import heapq
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Optional, Protocol, Tuple, TypeVar
+
+from app.core.audio import cleanup_session_files
+
+
+class TrackedSession(Protocol):
+    """Session state the expiry and eviction bookkeeping relies on."""
+
+    last_activity: datetime
+    in_turn: bool
+
+
+SessionT = TypeVar("SessionT", bound=TrackedSession)
+
+
+def _cleanup_files(session_ids: List[str]) -> None:
+    """Delete the audio files of each given session."""
+    for session_id in session_ids:
+        cleanup_session_files(session_id)
+
+
+async def delete_session_files(session_ids: List[str]) -> None:
+    """Delete the sessions' audio files in a worker thread.
+
+    The deletion is shielded so shutdown can't interrupt it halfway.
+
+    Args:
+        session_ids: IDs of sessions already removed from memory.
+    """
+    if session_ids:
+        await asyncio.shield(asyncio.to_thread(_cleanup_files, session_ids))
+
+
+def evict_overflow(sessions: "OrderedDict[str, SessionT]", limit: int) -> List[str]:
+    """Evict least recently used sessions while over the cap.
+
+    Sessions with a turn in progress are skipped, since deleting their files
+    would pull them out from under the running turn; if every session is busy
+    the cap is exceeded until a later call.
+
+    Args:
+        sessions: Sessions in least-recently-used order.
+        limit: Maximum number of sessions to keep.
+
+    Returns:
+        IDs of the evicted sessions, whose audio files still need deleting.
+    """
+    evicted_ids: List[str] = []
+    overflow = len(sessions) - limit
+    if overflow <= 0:
+        return evicted_ids
+    for session_id, session in list(sessions.items()):
+        if len(evicted_ids) == overflow:
+            break
+        if not session.in_turn:
+            del sessions[session_id]
+            evicted_ids.append(session_id)
+    return evicted_ids
+
+
+class ExpiryQueue:
+    """Schedule of session expiries that a cleanup task can sleep on."""
+
+    def __init__(self) -> None:
+        """Initialize an empty expiry queue."""
+        self._heap: List[Tuple[float, str]] = []
+        # Set when the heap goes from empty to non-empty to wake the cleanup
+        # task; created per wait so it always belongs to the running loop
+        self._scheduled: Optional[asyncio.Event] = None
+
+    def schedule(self, session_id: str, expires_at: float) -> None:
+        """Push a session's expiry, waking the cleanup task if it was idle.
+
+        Args:
+            session_id: The session identifier.
+            expires_at: Unix timestamp at which the session should be checked.
+        """
+        was_empty = not self._heap
+        heapq.heappush(self._heap, (expires_at, session_id))
+        if was_empty and self._scheduled is not None:
+            self._scheduled.set()
+
+    def _pop_due(self, now: float) -> List[str]:
+        """Remove and return the IDs of all entries due at the given time."""
+        due: List[str] = []
+        while self._heap and self._heap[0][0] <= now:
+            due.append(heapq.heappop(self._heap)[1])
+        return due
+
+    async def expire_due(
+        self, sessions: "OrderedDict[str, SessionT]", max_age_seconds: int
+    ) -> int:
+        """Remove sessions whose scheduled expiry has passed.
+
+        Only heap entries that have come due are examined. Sessions that saw
+        activity since they were scheduled are pushed back with their new
+        expiry. Sessions are dropped from memory on the event loop, then their
+        audio files are deleted.
+
+        Args:
+            sessions: Live sessions by ID.
+            max_age_seconds: Maximum idle time before a session is removed.
+
+        Returns:
+            Number of sessions removed.
+        """
+        now = time.time()
+        expired_ids: List[str] = []
+
+        for session_id in self._pop_due(now):
+            session = sessions.get(session_id)
+            if session is None:
+                continue
+
+            expires_at = session.last_activity.timestamp() + max_age_seconds
+            if expires_at > now:
+                self.schedule(session_id, expires_at)
+                continue
+
+            del sessions[session_id]
+            expired_ids.append(session_id)
+
+        await delete_session_files(expired_ids)
+        return len(expired_ids)
+
+    def seconds_until_next(self) -> Optional[float]:
+        """Get the delay until the earliest scheduled expiry.
+
+        Returns:
+            Seconds until the next expiry (0 if already due), or None if no
+            sessions are scheduled.
+        """
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - time.time())
+
+    async def wait(self) -> None:
+        """Sleep until the earliest expiry is due or a first one is scheduled."""
+        delay = self.seconds_until_next()
+        self._scheduled = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._scheduled.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._scheduled = None
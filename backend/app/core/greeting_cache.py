@@ -0,0 +1,59 @@
+"""Bounded cache of generated session greetings.
+
+Greetings depend only on the target language, level, topic, model and
+provider, so a few generated variants per combination can be reused for later
+sessions.
+"""
+
+import random
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+# Number of (language, level, topic, model, base URL) keys kept in the LRU cache
+GREETING_CACHE_SIZE = 256
+# Greetings generated per key before cached ones are reused
+GREETING_VARIANTS = 3
+
+# (target language, proficiency level, topic, model, LLM base URL)
+GreetingKey = Tuple[str, str, str, str, Optional[str]]
+
+
+class GreetingCache:
+    """LRU cache holding up to GREETING_VARIANTS greetings per key."""
+
+    def __init__(self) -> None:
+        """Initialize an empty greeting cache."""
+        self._entries: "OrderedDict[GreetingKey, List[str]]" = OrderedDict()
+
+    def get(self, key: GreetingKey) -> Optional[str]:
+        """Return a random cached greeting once the key has all its variants.
+
+        Args:
+            key: Greeting cache key.
+
+        Returns:
+            A cached greeting, or None if another variant should be generated.
+        """
+        variants = self._entries.get(key)
+        if variants is None or len(variants) < GREETING_VARIANTS:
+            return None
+        self._entries.move_to_end(key)
+        return random.choice(variants)
+
+    def add(self, key: GreetingKey, greeting: str) -> None:
+        """Store a newly generated greeting, evicting the oldest key at the cap.
+
+        Greetings beyond GREETING_VARIANTS for a key, e.g. from concurrent
+        misses, are dropped.
+
+        Args:
+            key: Greeting cache key.
+            greeting: Generated greeting text.
+        """
+        variants = self._entries.setdefault(key, [])
+        self._entries.move_to_end(key)
+        if len(variants) >= GREETING_VARIANTS:
+            return
+        variants.append(greeting)
+        if len(self._entries) > GREETING_CACHE_SIZE:
+            self._entries.popitem(last=False)
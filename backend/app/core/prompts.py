@@ -0,0 +1,155 @@
+"""System prompts and message builders for LLM conversations.
+
+The fixed prompts are sent as the first message of every request and must
+stay byte-identical (no interpolation) so providers can serve them from their
+prompt prefix cache. Per-session details go in a following system message.
+"""
+
+from typing import Dict, List
+
+from openai.types.chat import (
+    ChatCompletionAssistantMessageParam,
+    ChatCompletionMessageParam,
+    ChatCompletionSystemMessageParam,
+    ChatCompletionUserMessageParam,
+)
+
+GREETING_SYSTEM_PROMPT = (
+    "You are a helpful language learning assistant. Your name is Luna.\n\n"
+    "Generate a friendly greeting that:\n"
+    "1. Welcomes the user warmly\n"
+    "2. Suggests the conversation topic given below\n"
+    "3. Asks an opening question to start the practice\n\n"
+    "Keep your response appropriate for the learner's level. "
+    "Keep the greeting short and to the point.\n\n"
+    "DO NOT use any markdown formatting such as bold (**text**), italics "
+    "(*text*), or lists. Return only pure text sentences."
+)
+
+TUTOR_SYSTEM_PROMPT = (
+    "You are a helpful language learning assistant named Luna, helping a "
+    "user practice a language.\n\n"
+    "Adjust your language complexity to match their proficiency.\n\n"
+    "Keep your responses concise (2-3 sentences max) and natural (as if "
+    "talking to a friend). Encourage the user to speak more.\n"
+    "DO NOT use any markdown formatting such as bold (**text**), italics "
+    "(*text*), or lists. Return only pure text sentences."
+)
+
+ANALYSIS_SYSTEM_PROMPT = (
+    "Analyze the grammar and vocabulary of the learner's lines (U:) in the "
+    "conversation; A: lines are the tutor.\n"
+    'Reply in JSON: {"summary": str, "feedback": [{"original_sentence": str, '
+    '"corrected_sentence": str, "explanation": str}]}.\n'
+    "original_sentence is the learner's exact sentence and corrected_sentence "
+    "its correction, both in the practiced language. Only include sentences "
+    "with real errors or a clearly more natural phrasing."
+)
+
+# Short speaker tags for the conversation sent to grammar analysis; other
+# roles (internal system instructions) are left out
+_ANALYSIS_ROLE_TAGS = {"user": "U", "assistant": "A"}
+
+
+def _system(content: str) -> ChatCompletionSystemMessageParam:
+    """Build a system message."""
+    return ChatCompletionSystemMessageParam(role="system", content=content)
+
+
+def greeting_messages(
+    target_language: str, proficiency_level: str, topic: str
+) -> List[ChatCompletionMessageParam]:
+    """Build the messages asking for a session's opening greeting.
+
+    Args:
+        target_language: Language the user is learning.
+        proficiency_level: CEFR proficiency level (A1-C2).
+        topic: Conversation topic to suggest.
+
+    Returns:
+        Fixed system prompt, session details, and the greeting request.
+    """
+    session_prompt = (
+        f"The user is learning {target_language} at {proficiency_level} "
+        f'level. Suggested topic: "{topic}"\n\n'
+        "CRITICAL: You MUST respond EXCLUSIVELY in "
+        f"{target_language}. All parts of your response (greeting, topic "
+        "suggestion, and question) must be in "
+        f"{target_language}. Keep the greeting concise (2-3 sentences)."
+    )
+    return [
+        _system(GREETING_SYSTEM_PROMPT),
+        _system(session_prompt),
+        ChatCompletionUserMessageParam(
+            role="user",
+            content=(
+                "Generate a greeting to start the practice session in "
+                f"{target_language} about the topic: {topic}"
+            ),
+        ),
+    ]
+
+
+def tutor_messages(
+    history: List[Dict[str, str]], target_language: str, proficiency_level: str
+) -> List[ChatCompletionMessageParam]:
+    """Build the messages for the tutor's next reply.
+
+    Args:
+        history: List of previous conversation turns.
+        target_language: Language the user is learning.
+        proficiency_level: CEFR proficiency level (A1-C2).
+
+    Returns:
+        Fixed system prompt, session details, then the conversation history.
+    """
+    session_prompt = (
+        f"The user is practicing {target_language} at {proficiency_level} "
+        "level.\n"
+        "CRITICAL: You MUST respond EXCLUSIVELY in "
+        f"{target_language}. Do not use any other language."
+    )
+    messages: List[ChatCompletionMessageParam] = [
+        _system(TUTOR_SYSTEM_PROMPT),
+        _system(session_prompt),
+    ]
+    messages.extend(
+        (
+            ChatCompletionUserMessageParam(role="user", content=msg["content"])
+            if msg["role"] == "user"
+            else ChatCompletionAssistantMessageParam(
+                role="assistant", content=msg["content"]
+            )
+        )
+        for msg in history
+    )
+    return messages
+
+
+def analysis_messages(
+    history: List[Dict[str, str]], primary_language: str, target_language: str
+) -> List[ChatCompletionMessageParam]:
+    """Build the messages asking for a grammar analysis of a conversation.
+
+    Args:
+        history: List of conversation turns.
+        primary_language: User's native language for explanations.
+        target_language: Language being learned for analysis.
+
+    Returns:
+        Fixed system prompt, language details, and the tagged conversation.
+    """
+    language_prompt = (
+        f"Practiced language: {target_language}. Write the summary and "
+        f"explanations in {primary_language}."
+    )
+    conversation_text = "\n".join(
+        f"{_ANALYSIS_ROLE_TAGS[h['role']]}: {h['content']}"
+        for h in history
+        if h["role"] in _ANALYSIS_ROLE_TAGS
+    )
+    return [
+        _system(ANALYSIS_SYSTEM_PROMPT),
+        _system(language_prompt),
+        ChatCompletionUserMessageParam(role="user", content=conversation_text),
+    ]
@@ -0,0 +1,69 @@
+"""Static file serving for generated audio."""
+
+import os
+from typing import Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, PathLike, StaticFiles
+from starlette.types import Scope
+
+
+class AudioFileResponse(FileResponse):
+    """FileResponse that streams audio in 1 MiB chunks instead of 64 KiB."""
+
+    chunk_size = 1 << 20
+
+
+class AudioStaticFiles(StaticFiles):
+    """StaticFiles variant for TTS output.
+
+    Files are streamed with large chunks. When ``accel_redirect_prefix`` is set,
+    the body is left to a fronting nginx via ``X-Accel-Redirect`` so the audio
+    payload never passes through Python.
+    """
+
+    def __init__(
+        self, *, directory: str, accel_redirect_prefix: Optional[str] = None
+    ) -> None:
+        """Initialize the audio static file app.
+
+        Args:
+            directory: Directory containing generated audio files.
+            accel_redirect_prefix: nginx internal location to redirect to
+                (optional).
+        """
+        super().__init__(directory=directory)
+        self.accel_redirect_prefix = (
+            accel_redirect_prefix.rstrip("/") if accel_redirect_prefix else None
+        )
+
+    def file_response(
+        self,
+        full_path: PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        """Build the response for a resolved file path.
+
+        Args:
+            full_path: Absolute path of the file to serve.
+            stat_result: Result of stat() on the file.
+            scope: ASGI request scope.
+            status_code: HTTP status code for the response.
+
+        Returns:
+            An X-Accel-Redirect response, a 304, or the streamed file.
+        """
+        if self.accel_redirect_prefix is not None:
+            relative = os.path.relpath(full_path, str(self.directory))
+            target = f"{self.accel_redirect_prefix}/{relative.replace(os.sep, '/')}"
+            return Response(headers={"X-Accel-Redirect": target})
+
+        response = AudioFileResponse(
+            full_path, status_code=status_code, stat_result=stat_result
+        )
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -6,11 +6,13 @@ This module provides:
 - Contextually appropriate conversation starters
 """
 
-from typing import Dict, List
+import random
+from functools import partial
+from typing import Callable, Dict, Tuple
 
-# Predefined conversation topics by proficiency level
-TOPICS_BY_LEVEL: Dict[str, List[str]] = {
-    "A1": [
+# Predefined conversation topics by proficiency level (tuples: fixed, compact)
+TOPICS_BY_LEVEL: Dict[str, Tuple[str, ...]] = {
+    "A1": (
         "Self introduction and basic personal information",
         "Spelling names and giving phone numbers",
         "Description of family members and household",
@@ -31,8 +33,8 @@ TOPICS_BY_LEVEL: Dict[str, List[str]] = {
         "Simple shopping interactions",
         "Discussion of transportation methods",
         "Description of activities done at home",
-    ],
-    "A2": [
+    ),
+    "A2": (
         "Planning a weekend or short trip",
         "Discussion of jobs or fields of study",
         "Description of daily life at work or school",
@@ -53,8 +55,8 @@ TOPICS_BY_LEVEL: Dict[str, List[str]] = {
         "Explanation of rules for a simple game",
         "Discussion of transportation and travel problems",
         "Discussion of likes and preferences in detail",
-    ],
-    "B1": [
+    ),
+    "B1": (
         "Description of significant personal experiences",
         "Discussion of challenges and problem-solving experiences",
         "Discussion of advantages and disadvantages of social media",
@@ -75,8 +77,8 @@ TOPICS_BY_LEVEL: Dict[str, List[str]] = {
         "Comparison of urban and rural lifestyles",
         "Discussion of money and happiness",
         "Discussion of friendships and relationships",
-    ],
-    "B2": [
+    ),
+    "B2": (
         "Debate on the influence of social media on society",
         "Analysis of the impact of technology on work and communication",
         "Discussion of environmental policies and responsibility",
@@ -97,8 +99,8 @@ TOPICS_BY_LEVEL: Dict[str, List[str]] = {
         "Analysis of cultural stereotypes",
         "Discussion of immigration and multicultural societies",
         "Evaluation of long-term technological consequences",
-    ],
-    "C1": [
+    ),
+    "C1": (
         "In-depth analysis of social and political issues",
         "Discussion of abstract concepts such as identity and freedom",
         "Debate on ethical dilemmas in emerging technologies",
@@ -119,8 +121,8 @@ TOPICS_BY_LEVEL: Dict[str, List[str]] = {
         "Debate on privacy in the digital age",
         "Discussion of philosophical perspectives on happiness and meaning",
         "Evaluation of long-term societal trends",
-    ],
-    "C2": [
+    ),
+    "C2": (
         "Advanced academic and theoretical discourse",
         "Analysis of abstract philosophical frameworks",
         "Debate on complex moral and ethical systems",
@@ -141,13 +143,18 @@ TOPICS_BY_LEVEL: Dict[str, List[str]] = {
         "Discussion of the philosophy of science",
         "Analysis of the nature of reality and existence",
         "Spontaneous, nuanced argumentation",
-    ],
+    ),
 }
 
 
+# One prebuilt sampler per level, so each call is a single dict lookup
+_TOPIC_CHOOSERS: Dict[str, Callable[[], str]] = {
+    level: partial(random.choice, topics) for level, topics in TOPICS_BY_LEVEL.items()
+}
+# Sampler used when the requested level is unknown
+_DEFAULT_CHOOSER = _TOPIC_CHOOSERS["B1"]
+
+
 def get_topic_for_level(level: str) -> str:
     """Get a random topic appropriate for the specified proficiency level."""
-    import random
-
-    topics = TOPICS_BY_LEVEL.get(level, TOPICS_BY_LEVEL["B1"])
-    return random.choice(topics)
+    return _TOPIC_CHOOSERS.get(level, _DEFAULT_CHOOSER)()
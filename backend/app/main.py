@@ -2,7 +2,7 @@
 
 This module initializes the FastAPI application with:
 - Exception handlers for custom application exceptions
-- CORS middleware configuration
+- CORS and GZip middleware configuration
 - Startup/shutdown event handlers for model loading and cleanup
 - Background session cleanup task
 - Static file serving for audio outputs
@@ -10,36 +10,73 @@ This module initializes the FastAPI application with:
 """
 
 import asyncio
+import atexit
+import json
 import logging
-import os
+import queue
+import sys
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response
 
 from app.api.v1.api import api_router
+from app.core.audio import cleanup_orphaned_files, shutdown_audio_executor
 from app.core.config import settings
-from app.core.exceptions import AppException
+from app.core.exceptions import (
+    AppException,
+    ASRError,
+    LLMError,
+    SessionError,
+    SessionNotFoundError,
+    TTSError,
+    ValidationError,
+)
+from app.core.static_files import AudioStaticFiles
 from app.services.asr_service import asr_service
+from app.services.llm_service import llm_service
 from app.services.session_manager import session_manager
 from app.services.tts_service import tts_service
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+# Configure logging. Records are handed to a queue and written by a listener
+# thread, so emitting a log line never blocks the event loop on stream I/O.
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 )
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
+log_listener = QueueListener(_log_queue, _log_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
 app = FastAPI(title=settings.PROJECT_NAME)
+
+# Global reference to the cleanup task
 cleanup_task: Optional[asyncio.Task] = None
 
 
+@lru_cache(maxsize=256)
+def _render_error_body(error_code: str, message: str) -> bytes:
+    """Render the JSON body of a detail-less error response.
+
+    Repeated errors (e.g. the same inactive-session message) reuse the bytes.
+    """
+    return json.dumps(
+        {"error_code": error_code, "message": message, "detail": None},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
 @app.exception_handler(AppException)
-async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
+async def app_exception_handler(request: Request, exc: AppException) -> Response:
     """Handle custom application exceptions.
 
     Args:
@@ -47,11 +84,17 @@ async def app_exception_handler(request: Request, exc: AppException) -> JSONResp
         exc: The custom application exception.
 
     Returns:
-        JSONResponse with structured error information.
+        JSON response with structured error information.
     """
     logger.error(
-        f"AppException: {exc.error_code} - {exc.message} - Detail: {exc.detail}"
+        "AppException: %s - %s - Detail: %s", exc.error_code, exc.message, exc.detail
     )
+    if exc.detail is None:
+        return Response(
+            content=_render_error_body(exc.error_code, exc.message),
+            status_code=exc.status_code,
+            media_type="application/json",
+        )
     return JSONResponse(
         status_code=exc.status_code,
         content={
@@ -62,6 +105,19 @@ async def app_exception_handler(request: Request, exc: AppException) -> JSONResp
     )
 
 
+# Register each concrete subclass directly so Starlette's handler lookup hits on
+# the exception's own type instead of walking its MRO to AppException
+for _exc_class in (
+    SessionError,
+    SessionNotFoundError,
+    ASRError,
+    TTSError,
+    LLMError,
+    ValidationError,
+):
+    app.exception_handler(_exc_class)(app_exception_handler)
+
+
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """Handle unexpected exceptions.
@@ -79,108 +135,159 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
         content={
             "error_code": "INTERNAL_SERVER_ERROR",
             "message": "An unexpected error occurred",
-            "detail": str(exc),
+            # Only the type name; the full exception is in the log above
+            "detail": type(exc).__name__,
         },
     )
 
 
-# Global reference to the cleanup task
-cleanup_task = None
+def _log_background_failure(task: asyncio.Task) -> None:
+    """Log a background task that stopped with an exception.
+
+    Args:
+        task: The finished task.
+    """
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(
+            "Background task %s stopped unexpectedly",
+            task.get_name(),
+            exc_info=task.exception(),
+        )
 
 
 @app.on_event("startup")
 async def startup_event() -> None:
     """Initialize application on startup.
 
-    Loads AI models, cleans up orphaned audio files, and starts
-    the background session cleanup task.
+    Loads the TTS model and user settings, cleans up orphaned audio files,
+    and starts the background session cleanup task.
     """
-    print("Starting up... Loading AI models.")
-    asr_service.load_model()
-    tts_service.load_model()
-    print("AI models loaded.")
+    logger.info("Starting up... Loading TTS model.")
+    llm_service.warmup()
+    # The ASR model is loaded on the first transcription unless preloading;
+    # when preloading, it loads on its own thread alongside the TTS model
+    await asyncio.gather(
+        asyncio.to_thread(tts_service.load_model),
+        asr_service.warmup() if settings.ASR_PRELOAD else asyncio.sleep(0),
+    )
+    logger.info("TTS model loaded.")
 
     # Clean up orphaned audio files from previous crashes/abnormal termination
-    from app.core.audio import cleanup_orphaned_files
-
     deleted_count = cleanup_orphaned_files(max_age_hours=2)
     if deleted_count > 0:
-        print(f"Cleaned up {deleted_count} orphaned audio file(s) from previous runs.")
+        logger.info(
+            "Cleaned up %d orphaned audio file(s) from previous runs.", deleted_count
+        )
 
     # Start session cleanup background task
     global cleanup_task
-    cleanup_task = asyncio.create_task(session_cleanup_task())
+    cleanup_task = asyncio.create_task(session_cleanup_task(), name="session-cleanup")
+    cleanup_task.add_done_callback(_log_background_failure)
 
 
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
     """Clean up resources on shutdown.
 
-    Cancels the background session cleanup task.
+    Cancels the background session cleanup task, stops the audio
+    conversion and ASR threads, and closes the LLM client's connections.
     """
-    print("Shutting down... cancelling background tasks.")
+    logger.info("Shutting down... cancelling background tasks.")
     if cleanup_task and not cleanup_task.done():
         cleanup_task.cancel()
         try:
             await cleanup_task
         except asyncio.CancelledError:
-            print("Cleanup task cancelled successfully.")
+            logger.info("Cleanup task cancelled successfully.")
+
+    shutdown_audio_executor()
+    asr_service.shutdown()
+    await llm_service.aclose()
 
 
 async def session_cleanup_task() -> None:
-    """Clean up expired sessions periodically.
+    """Clean up expired sessions as they come due.
 
-    Runs in the background, removing sessions older than 1 hour
-    every 10 minutes.
+    Runs in the background, sleeping until the earliest scheduled session
+    expiry (or until a session is scheduled when none are pending) and
+    removing sessions idle for more than 1 hour. Cancellation propagates
+    straight out of the wait and is reported by shutdown_event.
     """
-    try:
-        while True:
-            try:
-                # Clean up sessions older than 1 hour (3600 seconds)
-                removed_count = session_manager.cleanup_expired_sessions(
-                    max_age_seconds=3600
-                )
-                if removed_count > 0:
-                    print(f"Cleaned up {removed_count} expired sessions.")
-            except Exception as e:
-                print(f"Error in session cleanup task: {e}")
-
-            # Wait for 10 minutes
-            await asyncio.sleep(600)
-    except asyncio.CancelledError:
-        print("Session cleanup task received cancellation signal.")
-        raise
+    while True:
+        try:
+            removed_count = await session_manager.expire_due_sessions()
+            if removed_count > 0:
+                logger.info("Cleaned up %d expired sessions.", removed_count)
+        except Exception:
+            logger.exception("Error in session cleanup task")
+
+        await session_manager.wait_for_next_expiry()
 
 
 # CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, replace with specific origins
-    allow_credentials=True,
+    allow_origins=settings.CORS_ORIGINS,
+    # The frontend sends no cookies; credentials only apply to explicit origins
+    allow_credentials="*" not in settings.CORS_ORIGINS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress larger JSON payloads (history lists and transcripts)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
 # API Router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 # Mount static directory for audio files
 # We mount data/outputs to /static so frontend can access generated audio
-# Ensure the directory exists
-os.makedirs(settings.AUDIO_OUTPUT_DIR, exist_ok=True)
-app.mount("/static", StaticFiles(directory=settings.AUDIO_OUTPUT_DIR), name="static")
+# (app.core.config creates the directory on import)
+if settings.SERVE_STATIC:
+    app.mount(
+        "/static",
+        AudioStaticFiles(
+            directory=settings.AUDIO_OUTPUT_DIR,
+            accel_redirect_prefix=settings.STATIC_ACCEL_REDIRECT_PREFIX,
+        ),
+        name="static",
+    )
+else:
+    logger.info(
+        "Static audio is not served by the app; expecting the reverse proxy to "
+        "serve %s at /static.",
+        settings.AUDIO_OUTPUT_DIR,
+    )
+
+
+# The root response never changes, so its body is rendered once
+_ROOT_BODY = json.dumps({"message": "Welcome to Speaking Practice App API"}).encode()
+_ROOT_HEADERS = {"Cache-Control": "public, max-age=3600"}
 
 
 @app.get("/")
-def read_root() -> dict[str, str]:
+async def read_root() -> Response:
     """Return welcome message.
 
     Returns:
-        Dictionary with welcome message.
+        Pre-rendered JSON response with the welcome message.
     """
-    return {"message": "Welcome to Speaking Practice App API"}
+    return Response(
+        content=_ROOT_BODY, media_type="application/json", headers=_ROOT_HEADERS
+    )
 
 
 def main() -> None:
-    """Start the development server."""
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
+    """Start the development server.
+
+    Runs on uvloop and httptools, both installed with uvicorn[standard].
+    uvloop does not support Windows, which keeps the default asyncio loop.
+    """
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+    )
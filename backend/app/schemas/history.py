@@ -7,7 +7,7 @@ This module defines schemas for:
 
 from typing import List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from app.schemas.session import Feedback, Turn
 
@@ -15,6 +15,8 @@ from app.schemas.session import Feedback, Turn
 class SessionHistoryItem(BaseModel):
     """Summary item for history list view."""
 
+    model_config = ConfigDict(frozen=True)
+
     session_id: str
     timestamp: str  # ISO format
     primary_language: str
@@ -25,7 +27,12 @@ class SessionHistoryItem(BaseModel):
 
 
 class SessionHistoryDetail(BaseModel):
-    """Full session detail for History detail view."""
+    """Full session detail for History detail view.
+
+    Frozen because HistoryService caches and shares detail instances.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     session_id: str
     timestamp: str
@@ -8,12 +8,14 @@ This module defines schemas for:
 
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Turn(BaseModel):
     """Represents a single turn in the conversation."""
 
+    model_config = ConfigDict(frozen=True)
+
     role: str  # 'user', 'assistant', or 'system'
     text: str
     audio_url: Optional[str] = None
@@ -50,6 +52,8 @@ class TurnResponse(BaseModel):
 class Feedback(BaseModel):
     """Schema for grammar feedback on user sentences."""
 
+    model_config = ConfigDict(frozen=True)
+
     original_sentence: str
     corrected_sentence: str
     explanation: str
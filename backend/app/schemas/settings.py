@@ -7,12 +7,16 @@ This module defines schemas for:
 - Settings validation with field validators
 """
 
-from typing import Optional
+from typing import FrozenSet, Optional
 
 from pydantic import BaseModel, field_validator
 
 from app.services.tts_service import LANGUAGE_CONFIG
 
+# Built once; validators only need membership and the error-message listing
+_SUPPORTED_LANGUAGES: FrozenSet[str] = frozenset(LANGUAGE_CONFIG)
+_SUPPORTED_LANGUAGES_STR = ", ".join(LANGUAGE_CONFIG)
+
 
 class UserSettings(BaseModel):
     """User configuration settings for the practice app."""
@@ -42,11 +46,10 @@ class UserSettings(BaseModel):
     @classmethod
     def validate_primary_language(cls, v: str) -> str:
         """Validate primary language is supported."""
-        supported_languages = list(LANGUAGE_CONFIG.keys())
-        if v not in supported_languages:
+        if v not in _SUPPORTED_LANGUAGES:
             raise ValueError(
                 f"Primary language '{v}' is not supported. "
-                f"Supported languages: {', '.join(supported_languages)}"
+                f"Supported languages: {_SUPPORTED_LANGUAGES_STR}"
             )
         return v
 
@@ -54,10 +57,9 @@ class UserSettings(BaseModel):
     @classmethod
     def validate_target_language(cls, v: str) -> str:
         """Validate target language is supported."""
-        supported_languages = list(LANGUAGE_CONFIG.keys())
-        if v not in supported_languages:
+        if v not in _SUPPORTED_LANGUAGES:
             raise ValueError(
                 f"Target language '{v}' is not supported. "
-                f"Supported languages: {', '.join(supported_languages)}"
+                f"Supported languages: {_SUPPORTED_LANGUAGES_STR}"
             )
         return v
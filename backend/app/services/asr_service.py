@@ -1,16 +1,98 @@
 """Automatic Speech Recognition (ASR) service for transcribing audio.
 
 This module provides the ASRService class which handles:
-- Platform-specific model loading (Parakeet MLX on macOS, NeMo on Windows/Linux)
+- Platform-specific model loading (Parakeet MLX on macOS, NeMo on Windows/Linux),
+  deferred until the first transcription
 - Audio transcription with fallback handling
+- Caching transcriptions of identical audio by content hash
+- Decoding 16 kHz uploads once and handing NeMo the samples directly
+- Running model loading and inference on a dedicated thread, off the event loop
 - Graceful degradation when ASR libraries are not available
 """
 
+import asyncio
+import contextlib
+import hashlib
 import sys
-from typing import Any, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, ContextManager, Optional
 
+import numpy as np
+import soundfile as sf
+
+from app.core.config import settings
 from app.core.exceptions import ASRError
 
+# Number of transcriptions kept in the content-hash LRU cache
+TRANSCRIPTION_CACHE_SIZE = 256
+# Read size when hashing audio files
+_HASH_CHUNK_SIZE = 1 << 20
+# Sample rate the ASR models expect (uploads are converted to it on save)
+ASR_SAMPLE_RATE = 16000
+
+
+def _hash_audio_file(audio_path: str) -> Optional[str]:
+    """Hash an audio file's contents for the transcription cache.
+
+    Args:
+        audio_path: Path to the audio file.
+
+    Returns:
+        Hex digest of the file, or None if it can't be read.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(audio_path, "rb") as f:
+            while chunk := f.read(_HASH_CHUNK_SIZE):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _read_asr_ready_audio(audio_path: str) -> Optional[np.ndarray]:
+    """Decode an audio file into float32 mono samples at the ASR sample rate.
+
+    Args:
+        audio_path: Path to the audio file.
+
+    Returns:
+        The samples, or None if the file can't be decoded or would need
+        resampling (the model then reads the file itself).
+    """
+    samples: np.ndarray
+    sample_rate: int
+    try:
+        with open(audio_path, "rb") as f:
+            samples, sample_rate = sf.read(f, dtype="float32", always_2d=False)
+    except (OSError, RuntimeError):
+        return None
+    if sample_rate != ASR_SAMPLE_RATE:
+        return None
+    if samples.ndim > 1:
+        samples = samples.mean(axis=1, dtype=np.float32)
+    return samples
+
+
+def _nemo_inference_context() -> Callable[[], ContextManager[Any]]:
+    """Pick the context NeMo inference runs under.
+
+    Returns:
+        A bfloat16 CUDA autocast factory when enabled and supported by the GPU,
+        otherwise a no-op context factory (full precision).
+    """
+    import torch
+
+    if (
+        settings.ASR_BF16
+        and torch.cuda.is_available()
+        and torch.cuda.is_bf16_supported()
+    ):
+        return partial(torch.autocast, "cuda", dtype=torch.bfloat16)
+    return contextlib.nullcontext
+
 
 class ASRService:
     """Handles audio transcription using platform-specific ASR models.
@@ -22,13 +104,31 @@ class ASRService:
     def __init__(self) -> None:
         """Initialize the ASR service."""
         self.model: Optional[Any] = None
+        # The model is loaded on first use; the lock keeps concurrent first
+        # turns from loading it twice. Created on first use so it belongs to
+        # the running loop
+        self._load_lock: Optional[asyncio.Lock] = None
+        self._load_attempted = False
+        # Re-submitted audio (e.g. a retried upload) skips inference
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        # Single thread that owns the model: inference never blocks the event
+        # loop, and calls into the model are serialized
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Wraps each NeMo transcribe call (e.g. mixed-precision autocast)
+        self._inference_context: Callable[[], ContextManager[Any]] = (
+            contextlib.nullcontext
+        )
 
     def load_model(self) -> None:
         """Load the appropriate ASR model based on the platform.
 
         Loads Parakeet MLX on macOS and NeMo on Windows/Linux.
         Falls back to mock transcription if libraries are unavailable.
+        Does nothing if a model is already loaded.
         """
+        if self.model is not None:
+            return
+
         # Platform-specific imports handling
         IS_MAC = sys.platform == "darwin"
 
@@ -47,9 +147,52 @@ class ASRService:
                 self.model = nemo_asr.models.ASRModel.from_pretrained(
                     model_name="nvidia/parakeet-tdt-0.6b-v3"
                 )
+                self._inference_context = _nemo_inference_context()
         except ImportError:
             print("ASR libraries not installed. Falling back to Mock.")
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the ASR thread, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="asr")
+        return self._executor
+
+    def shutdown(self) -> None:
+        """Shut down the ASR thread, waiting for a running transcription."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def _ensure_model_loaded(self) -> None:
+        """Load the model on the ASR thread on first use.
+
+        The load is attempted once; if it fails, later turns fall back to mock
+        transcription instead of retrying it.
+        """
+        if self.model is not None or self._load_attempted:
+            return
+
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        async with self._load_lock:
+            if self.model is None and not self._load_attempted:
+                loop = asyncio.get_running_loop()
+                try:
+                    await loop.run_in_executor(self._get_executor(), self.load_model)
+                finally:
+                    self._load_attempted = True
+
+    async def warmup(self) -> None:
+        """Load the model ahead of the first transcription."""
+        await self._ensure_model_loaded()
+
+    def _transcribe_sync(self, audio_path: str) -> str:
+        """Run the platform-specific model on the ASR thread."""
+        if sys.platform == "darwin":
+            return self._transcribe_mac(audio_path)
+        # NeMo for Windows and Linux
+        return self._transcribe_nemo(audio_path)
+
     def _transcribe_mac(self, audio_path: str) -> str:
         """Transcribe audio using Parakeet MLX on macOS."""
         assert self.model is not None, "Model must be loaded to transcribe"
@@ -59,7 +202,15 @@ class ASRService:
     def _transcribe_nemo(self, audio_path: str) -> str:
         """Transcribe audio using NeMo on Windows/Linux."""
         assert self.model is not None, "Model must be loaded to transcribe"
-        output: Any = self.model.transcribe([audio_path])
+        # Passing decoded samples skips NeMo re-reading the file through its
+        # own dataloader
+        samples = _read_asr_ready_audio(audio_path)
+        with self._inference_context():
+            output: Any
+            if samples is not None:
+                output = self.model.transcribe([samples], batch_size=1)
+            else:
+                output = self.model.transcribe([audio_path])
         transcription = self._extract_nemo_transcription(output)
         if transcription is not None:
             return transcription
@@ -73,29 +224,26 @@ class ASRService:
 
     def _extract_nemo_transcription(self, output: Any) -> Optional[str]:
         """Extract transcription text from NeMo output."""
-        if isinstance(output, tuple) and len(output) > 0:
-            return self._extract_nemo_item(output[0])
-
-        if isinstance(output, list) and len(output) > 0:
+        if isinstance(output, (tuple, list)) and output:
             return self._extract_nemo_item(output[0])
 
         return None
 
     def _extract_nemo_item(self, item: Any) -> Optional[str]:
         """Normalize a single NeMo output element into text."""
-        result: Optional[str] = None
-        if isinstance(item, list) and len(item) > 0:
+        if isinstance(item, list) and item:
             item = item[0]
 
-        if isinstance(item, str):
-            result = item
-        elif hasattr(item, "text"):
-            result = str(item.text)
-        elif isinstance(item, dict):
-            if "text" in item:
-                result = str(item["text"])
-            elif "transcription" in item:
-                result = str(item["transcription"])
+        result: Optional[str] = None
+        match item:
+            case str():
+                result = item
+            case _ if hasattr(item, "text"):
+                result = str(item.text)
+            case {"text": text}:
+                result = str(text)
+            case {"transcription": text}:
+                result = str(text)
 
         return result
 
@@ -111,6 +259,10 @@ class ASRService:
         Raises:
             ASRError: If transcription fails.
         """
+        try:
+            await self._ensure_model_loaded()
+        except Exception as e:
+            raise ASRError(message=f"ASR model failed to load: {str(e)}")
         if self.model is None:
             # For development, we might still want to return mock text instead of
             # crashing. The issue says "strict error logging and specific error
@@ -120,16 +272,24 @@ class ASRService:
                 "loaded)."
             )
 
-        try:
-            IS_MAC = sys.platform == "darwin"
+        key = await asyncio.to_thread(_hash_audio_file, audio_path)
+        if key is not None and key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
 
-            if IS_MAC:
-                return self._transcribe_mac(audio_path)
-            else:
-                # NeMo for Windows and Linux
-                return self._transcribe_nemo(audio_path)
+        try:
+            loop = asyncio.get_running_loop()
+            text = await loop.run_in_executor(
+                self._get_executor(), self._transcribe_sync, audio_path
+            )
         except Exception as e:
             raise ASRError(message=f"Transcription failed: {str(e)}")
 
+        if key is not None:
+            self._cache[key] = text
+            if len(self._cache) > TRANSCRIPTION_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return text
+
 
 asr_service = ASRService()
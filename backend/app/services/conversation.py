@@ -0,0 +1,206 @@
+"""Conversation steps for a live practice session.
+
+This module holds the per-session state and the steps the session manager
+chains together:
+- Greeting a new session
+- Replying to a user turn, including the final-turn wrap-up
+- Wrapping up a session stopped early
+- Archiving an ended session to history
+"""
+
+import asyncio
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Tuple
+
+from app.core.audio import cleanup_session_files
+from app.schemas.session import SessionAnalysis, SessionCreate, Turn, TurnResponse
+from app.services.history_service import history_service
+from app.services.llm_service import llm_service
+from app.services.tts_service import tts_service
+
+# Sessions end after this many user turns
+MAX_TURNS = 15
+
+# Appended to the history when the user stops the session early
+_WRAP_UP_PROMPT = (
+    "The user has decided to stop the session. Please provide a brief, "
+    "polite wrap-up message in the target language."
+)
+
+
+def utc_now() -> datetime:
+    """Return the current time in UTC."""
+    return datetime.now(timezone.utc)
+
+
+@dataclass(slots=True)
+class ActiveSession:
+    """In-memory state of a live conversation session."""
+
+    id: str
+    settings: SessionCreate
+    history: List[Dict[str, str]] = field(default_factory=list)
+    turn_count: int = 0
+    is_active: bool = True
+    last_activity: datetime = field(default_factory=utc_now)
+    tts_speed: float = 1.0
+    # Set while a greeting, turn or wrap-up is writing into the session's
+    # audio directories; such sessions are never evicted
+    in_turn: bool = False
+
+
+@contextmanager
+def turn_in_progress(session: ActiveSession) -> Iterator[ActiveSession]:
+    """Mark a session as busy for the duration of the block."""
+    session.in_turn = True
+    try:
+        yield session
+    finally:
+        session.in_turn = False
+
+
+async def greet(session: ActiveSession) -> Turn:
+    """Generate and synthesize the opening greeting of a session.
+
+    Args:
+        session: The newly created session.
+
+    Returns:
+        The greeting turn, which is also added to the history.
+
+    Raises:
+        LLMError: If greeting generation fails.
+        TTSError: If audio synthesis fails.
+    """
+    settings = session.settings
+    # Generate LLM greeting based on user settings
+    greeting = await llm_service.generate_greeting(
+        settings.target_language,
+        settings.proficiency_level,
+        settings.primary_language,
+    )
+
+    # Synthesize audio for the greeting
+    greeting_audio_url = await tts_service.synthesize(
+        greeting,
+        target_language=settings.target_language,
+        session_id=session.id,
+    )
+
+    session.history.append({"role": "assistant", "content": greeting})
+    return Turn(role="assistant", text=greeting, audio_url=greeting_audio_url)
+
+
+def is_stop_word(session: ActiveSession, user_text: str) -> bool:
+    """Check if user said the stop word to end the session."""
+    stop_word = (
+        session.settings.stop_word.lower()
+        if session.settings.stop_word
+        else "stop session"
+    )
+    return stop_word in user_text.lower()
+
+
+def mark_last_turn(session: ActiveSession) -> bool:
+    """Check if max turns has been reached and handle session ending."""
+    is_last_turn = session.turn_count >= MAX_TURNS
+
+    if is_last_turn:
+        session.history.append(
+            {
+                "role": "system",
+                "content": (
+                    "This is the final turn of the conversation. Please provide "
+                    "a natural closing message to wrap up the session in the "
+                    "target language."
+                ),
+            }
+        )
+        session.is_active = False
+
+    return is_last_turn
+
+
+async def reply(
+    session: ActiveSession, user_text: str, is_last_turn: bool
+) -> TurnResponse:
+    """Generate AI response and synthesize audio."""
+    ai_text = await llm_service.get_response(
+        session.history,
+        session.settings.target_language,
+        session.settings.proficiency_level,
+        session_id=session.id,
+    )
+    session.history.append({"role": "assistant", "content": ai_text})
+
+    # Synthesize Audio with user's preferred TTS speed
+    ai_audio_url = await tts_service.synthesize(
+        ai_text,
+        target_language=session.settings.target_language,
+        session_id=session.id,
+        speed=session.tts_speed,
+    )
+
+    return TurnResponse(
+        user_text=user_text,
+        ai_text=ai_text,
+        ai_audio_url=ai_audio_url,
+        is_session_ended=not session.is_active,
+        is_session_ending=is_last_turn,
+    )
+
+
+async def wrap_up(session: ActiveSession) -> Tuple[str, str]:
+    """Generate and synthesize the closing message of a session stopped early.
+
+    Args:
+        session: The session being stopped.
+
+    Returns:
+        Tuple of (wrap-up text, wrap-up audio URL).
+    """
+    session.history.append({"role": "system", "content": _WRAP_UP_PROMPT})
+
+    ai_text = await llm_service.get_response(
+        session.history,
+        session.settings.target_language,
+        session.settings.proficiency_level,
+        session_id=session.id,
+    )
+
+    # Synthesize
+    ai_audio_url = await tts_service.synthesize(
+        ai_text,
+        target_language=session.settings.target_language,
+        session_id=session.id,
+    )
+    return ai_text, ai_audio_url
+
+
+async def archive(session: ActiveSession, analysis: SessionAnalysis) -> None:
+    """Save an ended session to history and delete its audio files.
+
+    Both run in parallel in worker threads, off the event loop; neither
+    depends on the other.
+
+    Args:
+        session: The ended session.
+        analysis: Grammar analysis to store with the session.
+    """
+    await asyncio.gather(
+        asyncio.to_thread(
+            history_service.save_session,
+            session_id=session.id,
+            settings_data={
+                "primary_language": session.settings.primary_language,
+                "target_language": session.settings.target_language,
+                "proficiency_level": session.settings.proficiency_level,
+            },
+            history=session.history,
+            summary=analysis.summary,
+            feedback=[f.model_dump() for f in analysis.feedback],
+        ),
+        asyncio.to_thread(cleanup_session_files, session.id),
+    )
@@ -8,12 +8,21 @@ This module provides the HistoryService class which handles:
 
 import json
 import os
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from pydantic import TypeAdapter
+
 from app.core.config import settings
 from app.schemas.history import SessionHistoryDetail, SessionHistoryItem
-from app.schemas.session import Feedback, Turn
+
+# Number of session details kept in the in-memory LRU cache
+DETAIL_CACHE_SIZE = 256
+
+# Built once at import; validates the whole history list in a single core call
+_HISTORY_ITEMS_ADAPTER = TypeAdapter(List[SessionHistoryItem])
 
 
 class HistoryService:
@@ -23,6 +32,14 @@ class HistoryService:
         """Initialize the history service."""
         self.history_file = os.path.join(settings.DATA_DIR, "session_history.json")
         self._history: Optional[List[Dict[str, Any]]] = None
+        # Endpoints call into the service from worker threads
+        self._lock = threading.RLock()
+        # Saved sessions never change, so built details can be reused until deleted
+        self._detail_cache: "OrderedDict[str, SessionHistoryDetail]" = OrderedDict()
+        # Records by session ID, kept in step with _history
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        # Newest-first list view, rebuilt only after history changes
+        self._items: Optional[List[SessionHistoryItem]] = None
 
     def _load_history(self) -> List[Dict[str, Any]]:
         """Load history from disk."""
@@ -30,21 +47,29 @@ class HistoryService:
             return []
 
         try:
-            with open(self.history_file, "r") as f:
+            with open(self.history_file, "r", encoding="utf-8") as f:
                 data: Any = json.load(f)
-                return List[Dict[str, Any]](data)
-        except Exception as e:
+        except (OSError, ValueError) as e:
             print(f"Error loading history: {e}")
             return []
+        return data if isinstance(data, list) else []
 
     def _save_history(self) -> None:
-        """Persist history to disk."""
+        """Persist history to disk.
+
+        Writes compact JSON to a temporary file and renames it over the history
+        file, so a crash mid-write never leaves a truncated file behind.
+        """
         if self._history is not None:
+            tmp_file = self.history_file + ".tmp"
             try:
                 # Ensure directory exists
                 os.makedirs(os.path.dirname(self.history_file), exist_ok=True)
-                with open(self.history_file, "w") as f:
-                    json.dump(self._history, f, indent=2)
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(
+                        self._history, f, ensure_ascii=False, separators=(",", ":")
+                    )
+                os.replace(tmp_file, self.history_file)
             except Exception as e:
                 print(f"Error saving history: {e}")
 
@@ -52,6 +77,11 @@ class HistoryService:
         """Get cached history, loading from disk if needed."""
         if self._history is None:
             self._history = self._load_history()
+            # First record wins, as a scan of older files with duplicates would
+            self._by_id = {}
+            for record in self._history:
+                self._by_id.setdefault(record["session_id"], record)
+            self._items = None
         return self._history
 
     def save_session(
@@ -62,96 +92,131 @@ class HistoryService:
         summary: str,
         feedback: List[Dict[str, str]],
     ) -> None:
-        """Save a completed session to history."""
-        sessions = self._get_history()
+        """Save a completed session to history.
 
+        Saving a session ID that is already stored (e.g. a session ended
+        twice) replaces its record, so each session appears once.
+        """
         session_record = {
             "session_id": session_id,
             "timestamp": datetime.now().isoformat(),
             "primary_language": settings_data.get("primary_language", "Unknown"),
             "target_language": settings_data.get("target_language", "Unknown"),
             "proficiency_level": settings_data.get("proficiency_level", "Unknown"),
-            "turn_count": len([h for h in history if h.get("role") == "user"]),
+            "turn_count": sum(1 for h in history if h.get("role") == "user"),
             "turns": history,
             "summary": summary,
             "feedback": feedback,
         }
 
-        sessions.append(session_record)
-        self._history = sessions
-        self._save_history()
+        with self._lock:
+            sessions = self._get_history()
+            previous = self._by_id.get(session_id)
+            if previous is None:
+                sessions.append(session_record)
+            else:
+                sessions[sessions.index(previous)] = session_record
+            self._by_id[session_id] = session_record
+            self._detail_cache.pop(session_id, None)
+            self._items = None
+            self._save_history()
 
     def get_all_sessions(self) -> List[SessionHistoryItem]:
         """Get list of all sessions for history list view."""
-        sessions = self._get_history()
-
+        with self._lock:
+            if self._items is None:
+                self._items = self._build_items(self._get_history())
+            return list(self._items)
+
+    @staticmethod
+    def _build_items(sessions: List[Dict[str, Any]]) -> List[SessionHistoryItem]:
+        """Build the newest-first list view items from session records."""
         # Sort by timestamp, newest first
         sorted_sessions = sorted(
             sessions, key=lambda x: x.get("timestamp", ""), reverse=True
         )
 
-        return [
-            SessionHistoryItem(
-                session_id=s["session_id"],
-                timestamp=s["timestamp"],
-                primary_language=s["primary_language"],
-                target_language=s["target_language"],
-                proficiency_level=s["proficiency_level"],
-                turn_count=s["turn_count"],
-                summary=(
-                    s.get("summary", "")[:100] + "..."
-                    if len(s.get("summary", "")) > 100
-                    else s.get("summary", "")
-                ),
-            )
-            for s in sorted_sessions
-        ]
+        return _HISTORY_ITEMS_ADAPTER.validate_python(
+            [
+                {
+                    "session_id": s["session_id"],
+                    "timestamp": s["timestamp"],
+                    "primary_language": s["primary_language"],
+                    "target_language": s["target_language"],
+                    "proficiency_level": s["proficiency_level"],
+                    "turn_count": s["turn_count"],
+                    "summary": (
+                        s.get("summary", "")[:100] + "..."
+                        if len(s.get("summary", "")) > 100
+                        else s.get("summary", "")
+                    ),
+                }
+                for s in sorted_sessions
+            ]
+        )
 
     def get_session_by_id(self, session_id: str) -> Optional[SessionHistoryDetail]:
-        """Get full session detail by ID."""
-        sessions = self._get_history()
-
-        for s in sessions:
-            if s["session_id"] == session_id:
-                return SessionHistoryDetail(
-                    session_id=s["session_id"],
-                    timestamp=s["timestamp"],
-                    primary_language=s["primary_language"],
-                    target_language=s["target_language"],
-                    proficiency_level=s["proficiency_level"],
-                    turn_count=s["turn_count"],
-                    turns=[
-                        Turn(role=t["role"], text=t["content"])
+        """Get full session detail by ID, serving repeat lookups from an LRU cache."""
+        with self._lock:
+            cached = self._detail_cache.get(session_id)
+            if cached is not None:
+                self._detail_cache.move_to_end(session_id)
+                return cached
+
+            self._get_history()
+            s = self._by_id.get(session_id)
+            if s is None:
+                return None
+
+            # One validation call builds the detail with its nested turns/feedback
+            detail = SessionHistoryDetail.model_validate(
+                {
+                    "session_id": s["session_id"],
+                    "timestamp": s["timestamp"],
+                    "primary_language": s["primary_language"],
+                    "target_language": s["target_language"],
+                    "proficiency_level": s["proficiency_level"],
+                    "turn_count": s["turn_count"],
+                    "turns": [
+                        {"role": t["role"], "text": t["content"]}
                         for t in s.get("turns", [])
                     ],
-                    summary=s.get("summary", ""),
-                    feedback=[Feedback(**f) for f in s.get("feedback", [])],
-                )
-
-        return None
+                    "summary": s.get("summary", ""),
+                    "feedback": s.get("feedback", []),
+                }
+            )
+            self._detail_cache[session_id] = detail
+            if len(self._detail_cache) > DETAIL_CACHE_SIZE:
+                self._detail_cache.popitem(last=False)
+            return detail
 
     def delete_session(self, session_id: str) -> bool:
         """Delete a session from history."""
-        sessions = self._get_history()
-        original_length = len(sessions)
-
-        self._history = [s for s in sessions if s["session_id"] != session_id]
-
-        if len(self._history) < original_length:
+        with self._lock:
+            sessions = self._get_history()
+            self._detail_cache.pop(session_id, None)
+            if self._by_id.pop(session_id, None) is None:
+                return False
+
+            self._history = [s for s in sessions if s["session_id"] != session_id]
+            self._items = None
             self._save_history()
             return True
-        return False
 
     def delete_all_sessions(self) -> int:
         """Delete all sessions from history."""
-        sessions = self._get_history()
-        count = len(sessions)
-
-        if count > 0:
-            self._history = []
-            self._save_history()
-
-        return count
+        with self._lock:
+            sessions = self._get_history()
+            count = len(sessions)
+
+            self._detail_cache.clear()
+            if count > 0:
+                self._history = []
+                self._by_id = {}
+                self._items = None
+                self._save_history()
+
+            return count
 
 
 history_service = HistoryService()
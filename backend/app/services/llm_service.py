@@ -1,53 +1,130 @@
 """Large Language Model (LLM) service for AI conversations.
 
 This module provides the LLMService class which handles:
-- Dynamic OpenAI-compatible API client creation
+- OpenAI-compatible API client reuse, rebuilt when the settings change
 - Context-aware conversation responses based on proficiency level
+- Reuse of a few generated greetings per language, level and topic
 - Grammar analysis with bilingual feedback
 - Markdown text cleaning for audio synthesis
 - Integration with predefined CEFR topics
 """
 
-import json
+import asyncio
 import re
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from openai import AsyncOpenAI
-from openai.types.chat import (
-    ChatCompletionAssistantMessageParam,
-    ChatCompletionSystemMessageParam,
-    ChatCompletionUserMessageParam,
-)
 
 from app.core.exceptions import LLMError
+from app.core.greeting_cache import GreetingCache
+from app.core.prompts import analysis_messages, greeting_messages, tutor_messages
 from app.core.topics import get_topic_for_level
 from app.schemas.session import SessionAnalysis
 from app.services.settings_service import settings_service
 
+# Markdown stripped from LLM output before synthesis, compiled once. List
+# markers, links and emphasis share one alternation so the text is scanned once.
+_CODE_RE = re.compile(r"`{1,3}.*?`{1,3}", re.DOTALL)
+_MARKDOWN_RE = re.compile(
+    r"^\s*(?:[-+*]|\d+\.)\s+"  # list markers at start of lines
+    r"|\[([^\]]+)\]\([^\)]+\)"  # links [text](url) -> text
+    r"|[*_]{1,3}",  # bold/italic markers
+    re.MULTILINE,
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _replace_markdown(match: "re.Match[str]") -> str:
+    """Replace one markdown match: links keep their (cleaned) text."""
+    link_text = match.group(1)
+    if link_text is None:
+        return ""
+    return _MARKDOWN_RE.sub(_replace_markdown, link_text)
+
+
+# The OpenAI API accepts a prompt_cache_key routing hint; other
+# OpenAI-compatible servers may reject unknown request fields
+_OPENAI_BASE_URL = "https://api.openai.com/v1"
+
 
 class LLMService:
     """Handles LLM interactions for conversation practice.
 
-    Supports any OpenAI-compatible API with dynamic client creation
-    based on user settings.
+    Supports any OpenAI-compatible API. The client is reused across requests
+    and rebuilt when the configured API key or base URL changes.
     """
 
     def __init__(self) -> None:
         """Initialize the LLM service."""
-        # Client is now created dynamically per request to support setting changes
-        pass
+        # Reusing the client keeps its connection pool warm between turns
+        self._client: Optional[AsyncOpenAI] = None
+        self._client_key: Optional[Tuple[Optional[str], Optional[str]]] = None
+        # Background closes of clients replaced after a settings change
+        self._closing: Set["asyncio.Task[None]"] = set()
+        self._greeting_cache = GreetingCache()
 
     def _get_client(self) -> Tuple[AsyncOpenAI, str]:
-        """Create a dynamic OpenAI client based on current settings.
+        """Get the OpenAI client for the current settings.
 
         Returns:
             Tuple of (OpenAI client, model name).
         """
         user_settings = settings_service.get_settings()
-        client = AsyncOpenAI(
-            api_key=user_settings.llm_api_key, base_url=user_settings.llm_base_url
-        )
-        return client, user_settings.llm_model or "gpt-4o"
+        client_key = (user_settings.llm_api_key, user_settings.llm_base_url)
+        if self._client is None or client_key != self._client_key:
+            if self._client is not None:
+                self._close_in_background(self._client)
+            self._client = AsyncOpenAI(
+                api_key=user_settings.llm_api_key, base_url=user_settings.llm_base_url
+            )
+            self._client_key = client_key
+        return self._client, user_settings.llm_model or "gpt-4o"
+
+    def _close_in_background(self, client: AsyncOpenAI) -> None:
+        """Close a replaced client without blocking the current request.
+
+        Requests already running on the client finish before its connection
+        pool shuts down.
+
+        Args:
+            client: Client that is no longer used for new requests.
+        """
+        task = asyncio.get_running_loop().create_task(client.close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def warmup(self) -> None:
+        """Load the user settings and build the client ahead of the first request.
+
+        The client is only built once an API key is configured; until then the
+        first request reports the missing key as usual.
+        """
+        if settings_service.get_settings().llm_api_key:
+            self._get_client()
+
+    async def aclose(self) -> None:
+        """Close the current client and wait for replaced ones to finish closing."""
+        client, self._client, self._client_key = self._client, None, None
+        if client is not None:
+            await client.close()
+        if self._closing:
+            await asyncio.gather(*self._closing)
+
+    def _prompt_cache_body(self, session_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Build the extra request body that keeps a session on a warm prompt cache.
+
+        Args:
+            session_id: Conversation session the request belongs to (optional).
+
+        Returns:
+            Extra body with the prompt cache key, or None when not applicable.
+        """
+        if not session_id or self._client_key is None:
+            return None
+        base_url = (self._client_key[1] or "").rstrip("/")
+        if base_url != _OPENAI_BASE_URL:
+            return None
+        return {"prompt_cache_key": session_id}
 
     def _clean_text(self, text: str) -> str:
         """Remove markdown formatting and normalize whitespace for TTS.
@@ -59,16 +136,11 @@ class LLMService:
             Cleaned text with markdown removed and whitespace normalized.
         """
         # Remove code blocks and inline code (do this first)
-        text = re.sub(r"`{1,3}.*?`{1,3}", "", text, flags=re.DOTALL)
-        # Remove bold/italic markers
-        text = re.sub(r"[*_]{1,3}", "", text)
-        # Remove markdown links [text](url) -> text
-        text = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", text)
-        # Remove list markers at start of lines or after whitespace
-        text = re.sub(r"(?m)^\s*[-+*]\s+", "", text)
-        text = re.sub(r"(?m)^\s*\d+\.\s+", "", text)
+        text = _CODE_RE.sub("", text)
+        # Remove list markers, bold/italic markers and link syntax
+        text = _MARKDOWN_RE.sub(_replace_markdown, text)
         # Normalize whitespace
-        text = re.sub(r"\s+", " ", text).strip()
+        text = _WHITESPACE_RE.sub(" ", text).strip()
         return text
 
     async def generate_greeting(
@@ -79,6 +151,10 @@ class LLMService:
     ) -> str:
         """Generate a contextual greeting for starting a practice session.
 
+        Once GREETING_VARIANTS greetings exist for the same language, level,
+        topic, model and provider, one of them is reused instead of calling
+        the model.
+
         Args:
             target_language: Language the user is learning.
             proficiency_level: CEFR proficiency level (A1-C2).
@@ -95,57 +171,45 @@ class LLMService:
         # Get a predefined topic for the proficiency level
         topic = get_topic_for_level(proficiency_level)
 
-        system_prompt = (
-            "You are a helpful language learning assistant for "
-            f"{target_language} at {proficiency_level} level. Your name is Luna.\n\n"
-            "Generate a friendly greeting that:\n"
-            "1. Welcomes the user warmly\n"
-            f'2. Suggests the following conversation topic: "{topic}"\n'
-            "3. Asks an opening question to start the practice\n\n"
-            "Keep your response appropriate for a "
-            f"{proficiency_level} learner. "
-            "Keep the greeting short and to the point.\n\n"
-            "CRITICAL: You MUST respond EXCLUSIVELY in "
-            f"{target_language}. All parts of your response (greeting, topic "
-            "suggestion, and question) must be in "
-            f"{target_language}. Keep the greeting concise (2-3 sentences).\n\n"
-            "DO NOT use any markdown formatting such as bold (**text**), italics "
-            "(*text*), or lists. Return only pure text sentences."
-        )
+        # Providers can share model names, so the base URL is part of the key
+        base_url = settings_service.get_settings().llm_base_url
+        key = (target_language, proficiency_level, topic, model, base_url)
+        cached = self._greeting_cache.get(key)
+        if cached is not None:
+            return cached
 
         try:
             response = await client.chat.completions.create(
                 model=model,
-                messages=[
-                    ChatCompletionSystemMessageParam(
-                        role="system", content=system_prompt
-                    ),
-                    ChatCompletionUserMessageParam(
-                        role="user",
-                        content=(
-                            "Generate a greeting to start the practice session in "
-                            f"{target_language} about the topic: {topic}"
-                        ),
-                    ),
-                ],
+                messages=greeting_messages(target_language, proficiency_level, topic),
             )
             content = response.choices[0].message.content
-            return self._clean_text(content or "")
+            greeting = self._clean_text(content or "")
         except Exception as e:
             raise LLMError(message=f"Greeting generation failed: {str(e)}")
 
+        if greeting:
+            self._greeting_cache.add(key, greeting)
+        return greeting
+
     async def get_response(
         self,
         history: List[Dict[str, str]],
         target_language: str = "English",
         proficiency_level: str = "B1",
+        session_id: Optional[str] = None,
     ) -> str:
         """Generate an AI response based on conversation history.
 
+        A fixed system prompt comes first, then the session's language and
+        level, then the history, so every request shares a long prompt prefix
+        that can be served from the provider's prompt cache.
+
         Args:
             history: List of previous conversation turns.
             target_language: Language the user is learning.
             proficiency_level: CEFR proficiency level (A1-C2).
+            session_id: Session ID used as the prompt cache key (optional).
 
         Returns:
             AI response text in the target language.
@@ -155,39 +219,11 @@ class LLMService:
         """
         client, model = self._get_client()
 
-        system_prompt = (
-            "You are a helpful language learning assistant named Luna, helping a "
-            f"user practice {target_language} at {proficiency_level} level.\n\n"
-            "Adjust your language complexity to match their proficiency.\n\n"
-            "Keep your responses concise (2-3 sentences max) and natural (as if "
-            "talking to a friend). Encourage the user to speak more.\n"
-            "CRITICAL: You MUST respond EXCLUSIVELY in "
-            f"{target_language}. Do not use any other language.\n\n"
-            "DO NOT use any markdown formatting such as bold (**text**), italics "
-            "(*text*), or lists. Return only pure text sentences."
-        )
-
-        messages: List[
-            ChatCompletionSystemMessageParam
-            | ChatCompletionUserMessageParam
-            | ChatCompletionAssistantMessageParam
-        ] = [ChatCompletionSystemMessageParam(role="system", content=system_prompt)]
-        messages.extend(
-            [
-                (
-                    ChatCompletionUserMessageParam(role="user", content=msg["content"])
-                    if msg["role"] == "user"
-                    else ChatCompletionAssistantMessageParam(
-                        role="assistant", content=msg["content"]
-                    )
-                )
-                for msg in history
-            ]
-        )
-
         try:
             response = await client.chat.completions.create(
-                model=model, messages=messages
+                model=model,
+                messages=tutor_messages(history, target_language, proficiency_level),
+                extra_body=self._prompt_cache_body(session_id),
             )
             content = response.choices[0].message.content
             return self._clean_text(content or "")
@@ -214,47 +250,17 @@ class LLMService:
             LLMError: If analysis fails.
         """
         client, model = self._get_client()
-        prompt = (
-            "Analyze the user's grammar and vocabulary in the following conversation "
-            f"where they are practicing {target_language}.\n\n"
-            "IMPORTANT LANGUAGE REQUIREMENTS:\n"
-            f'- The "summary" field MUST be in {primary_language}\n'
-            f'- The "explanation" field in each feedback item MUST be in '
-            f"{primary_language}\n"
-            '- The "original_sentence" and "corrected_sentence" fields MUST be in '
-            f"{target_language} (the language being learned)\n\n"
-            "Return a JSON object with the following structure:\n"
-            "{\n"
-            f'    "summary": "Overall summary of performance in {primary_language}",\n'
-            '    "feedback": [\n'
-            "        {\n"
-            '            "original_sentence": "User\'s exact original sentence with '
-            f'error (in {target_language})",\n'
-            '            "corrected_sentence": "Corrected user sentence (in '
-            f'{target_language})",\n'
-            '            "explanation": "Brief explanation of the error in '
-            f'{primary_language}"\n'
-            "        }\n"
-            "    ]\n"
-            "}\n"
-            "Only include feedback for sentences that actually have errors or could "
-            "be improved naturally.\n"
-            'Focus on user messages (role: "user") when analyzing grammar.'
-        )
-
-        conversation_text = "\n".join([f"{h['role']}: {h['content']}" for h in history])
 
         try:
             response = await client.chat.completions.create(
                 model=model,
-                messages=[
-                    {"role": "system", "content": prompt},
-                    {"role": "user", "content": conversation_text},
-                ],
+                messages=analysis_messages(history, primary_language, target_language),
                 response_format={"type": "json_object"},
             )
-            data = json.loads(response.choices[0].message.content or "{}")
-            return SessionAnalysis(**data)
+            # Parse and validate the JSON in one pass through pydantic-core
+            return SessionAnalysis.model_validate_json(
+                response.choices[0].message.content or "{}"
+            )
         except Exception as e:
             raise LLMError(message=f"Analysis failure: {str(e)}")
 
@@ -8,12 +8,15 @@ This module provides the SessionManager class which handles:
 - Automatic cleanup of expired sessions
 """
 
+import time
 import uuid
-from datetime import datetime, timezone
-from typing import Dict, List, cast
+from collections import OrderedDict
+from operator import itemgetter
+from typing import List
 
-from app.core.audio import cleanup_session_files
+from app.core.config import settings as app_settings
 from app.core.exceptions import LLMError, SessionError, SessionNotFoundError, TTSError
+from app.core.expiry_queue import ExpiryQueue, delete_session_files, evict_overflow
 from app.schemas.session import (
     SessionAnalysis,
     SessionCreate,
@@ -21,10 +24,16 @@ from app.schemas.session import (
     Turn,
     TurnResponse,
 )
+from app.services import conversation
 from app.services.asr_service import asr_service
-from app.services.history_service import history_service
+from app.services.conversation import ActiveSession
 from app.services.llm_service import llm_service
-from app.services.tts_service import tts_service
+
+# Pulls (role, content) out of a history entry
+_ROLE_AND_CONTENT = itemgetter("role", "content")
+
+# Sessions idle for longer than this are removed by the cleanup task
+SESSION_MAX_AGE_SECONDS = 3600
 
 
 class SessionManager:
@@ -36,7 +45,10 @@ class SessionManager:
 
     def __init__(self) -> None:
         """Initialize the session manager."""
-        self.sessions: Dict[str, Dict] = {}
+        # Kept in least-recently-used order so the oldest can be evicted at the cap
+        self.sessions: "OrderedDict[str, ActiveSession]" = OrderedDict()
+        # Expiries are re-checked against last_activity when they come due
+        self._expiries = ExpiryQueue()
 
     async def create_session(self, settings: SessionCreate) -> SessionResponse:
         """Create a new conversation session.
@@ -53,41 +65,22 @@ class SessionManager:
             TTSError: If audio synthesis fails.
         """
         session_id = str(uuid.uuid4())
-        self.sessions[session_id] = {
-            "id": session_id,
-            "settings": settings,
-            "history": [],
-            "turn_count": 0,
-            "is_active": True,
-            "last_activity": datetime.now(timezone.utc),
-            "tts_speed": settings.tts_speed if settings.tts_speed is not None else 1.0,
-        }
+        session = ActiveSession(
+            id=session_id,
+            settings=settings,
+            tts_speed=settings.tts_speed if settings.tts_speed is not None else 1.0,
+        )
+        self.sessions[session_id] = session
+        self._expiries.schedule(session_id, time.time() + SESSION_MAX_AGE_SECONDS)
 
         try:
-            # Generate LLM greeting based on user settings
-            greeting = await llm_service.generate_greeting(
-                settings.target_language,
-                settings.proficiency_level,
-                settings.primary_language,
-            )
-
-            # Synthesize audio for the greeting
-            greeting_audio_url = await tts_service.synthesize(
-                greeting,
-                target_language=settings.target_language,
-                session_id=session_id,
-            )
-
-            self.sessions[session_id]["history"].append(
-                {"role": "assistant", "content": greeting}
-            )
-
+            with conversation.turn_in_progress(session):
+                await delete_session_files(
+                    evict_overflow(self.sessions, app_settings.MAX_SESSIONS)
+                )
+                greeting = await conversation.greet(session)
             return SessionResponse(
-                session_id=session_id,
-                turns=[
-                    Turn(role="assistant", text=greeting, audio_url=greeting_audio_url)
-                ],
-                is_active=True,
+                session_id=session_id, turns=[greeting], is_active=True
             )
         except Exception as e:
             # If initialization fails, clean up the session entry
@@ -97,97 +90,26 @@ class SessionManager:
                 raise e
             raise SessionError(message=f"Failed to start session: {str(e)}")
 
-    def _check_stop_word(self, session: Dict, user_text: str) -> bool:
-        """Check if user said the stop word to end the session."""
-        stop_word = (
-            session["settings"].stop_word.lower()
-            if session["settings"].stop_word
-            else "stop session"
-        )
-        return stop_word in user_text.lower()
-
-    async def _handle_stop_word_response(
-        self, session: Dict, session_id: str, user_text: str
-    ) -> TurnResponse:
-        """Handle the response when user says stop word."""
-        # Trigger wrap-up
-        session["history"].append({"role": "user", "content": user_text})
-
-        # Generate wrap-up message
-        wrap_up_prompt = (
-            "The user has decided to stop the session. Please provide a brief, "
-            "polite wrap-up message in the target language."
-        )
-        session["history"].append({"role": "system", "content": wrap_up_prompt})
-
-        ai_text = await llm_service.get_response(
-            session["history"],
-            session["settings"].target_language,
-            session["settings"].proficiency_level,
-        )
+    def get_active_session(self, session_id: str) -> ActiveSession:
+        """Look up a session that can still take turns.
 
-        # Synthesize
-        ai_audio_url = await tts_service.synthesize(
-            ai_text,
-            target_language=session["settings"].target_language,
-            session_id=session_id,
-        )
-
-        session["is_active"] = False
-        return TurnResponse(
-            user_text=user_text,
-            ai_text=ai_text,
-            ai_audio_url=ai_audio_url,
-            is_session_ended=True,
-            is_session_ending=True,
-        )
-
-    def _check_max_turns_reached(self, session: Dict) -> bool:
-        """Check if max turns (15) has been reached and handle session ending."""
-        turn_count = cast(int, session["turn_count"])
-        is_last_turn = turn_count >= 15
-
-        if is_last_turn:
-            session["history"].append(
-                {
-                    "role": "system",
-                    "content": (
-                        "This is the final turn of the conversation. Please provide "
-                        "a natural closing message to wrap up the session in the "
-                        "target language."
-                    ),
-                }
-            )
-            session["is_active"] = False
+        Args:
+            session_id: The session identifier.
 
-        return is_last_turn
+        Returns:
+            The active session.
 
-    async def _generate_response(
-        self, session: Dict, session_id: str, user_text: str, is_last_turn: bool
-    ) -> TurnResponse:
-        """Generate AI response and synthesize audio."""
-        ai_text = await llm_service.get_response(
-            session["history"],
-            session["settings"].target_language,
-            session["settings"].proficiency_level,
-        )
-        session["history"].append({"role": "assistant", "content": ai_text})
-
-        # Synthesize Audio with user's preferred TTS speed
-        ai_audio_url = await tts_service.synthesize(
-            ai_text,
-            target_language=session["settings"].target_language,
-            session_id=session_id,
-            speed=session.get("tts_speed", 1.0),
-        )
+        Raises:
+            SessionNotFoundError: If session doesn't exist.
+            SessionError: If session is inactive.
+        """
+        session = self.sessions.get(session_id)
+        if not session:
+            raise SessionNotFoundError.from_session_id(session_id)
 
-        return TurnResponse(
-            user_text=user_text,
-            ai_text=ai_text,
-            ai_audio_url=ai_audio_url,
-            is_session_ended=not session["is_active"],
-            is_session_ending=is_last_turn,
-        )
+        if not session.is_active:
+            raise SessionError(message="Cannot process turn on an inactive session")
+        return session
 
     async def process_turn(self, session_id: str, audio_file_path: str) -> TurnResponse:
         """Process a user audio turn in the conversation.
@@ -203,34 +125,44 @@ class SessionManager:
             SessionNotFoundError: If session doesn't exist.
             SessionError: If session is inactive.
         """
-        session = self.sessions.get(session_id)
-        if not session:
-            raise SessionNotFoundError.from_session_id(session_id)
-
-        if not session["is_active"]:
-            raise SessionError(message="Cannot process turn on an inactive session")
+        session = self.get_active_session(session_id)
 
         # Update last activity
-        session["last_activity"] = datetime.now(timezone.utc)
+        session.last_activity = conversation.utc_now()
+        self.sessions.move_to_end(session_id)
+
+        with conversation.turn_in_progress(session):
+            return await self._run_turn(session, audio_file_path)
 
+    async def _run_turn(
+        self, session: ActiveSession, audio_file_path: str
+    ) -> TurnResponse:
+        """Transcribe a user turn and generate the spoken reply."""
         # 1. Transcribe
         user_text = await asr_service.transcribe(audio_file_path)
 
         # 2. Check for stop word
-        if self._check_stop_word(session, user_text):
-            return await self._handle_stop_word_response(session, session_id, user_text)
+        if conversation.is_stop_word(session, user_text):
+            session.history.append({"role": "user", "content": user_text})
+            ai_text, ai_audio_url = await conversation.wrap_up(session)
+            session.is_active = False
+            return TurnResponse(
+                user_text=user_text,
+                ai_text=ai_text,
+                ai_audio_url=ai_audio_url,
+                is_session_ended=True,
+                is_session_ending=True,
+            )
 
         # 3. Update history and turn count
-        session["history"].append({"role": "user", "content": user_text})
-        session["turn_count"] += 1
+        session.history.append({"role": "user", "content": user_text})
+        session.turn_count += 1
 
         # 4. Check if max turns reached
-        is_last_turn = self._check_max_turns_reached(session)
+        is_last_turn = conversation.mark_last_turn(session)
 
         # 5. Generate response and synthesize
-        return await self._generate_response(
-            session, session_id, user_text, is_last_turn
-        )
+        return await conversation.reply(session, user_text, is_last_turn)
 
     async def end_session(self, session_id: str) -> SessionAnalysis:
         """End a session and generate grammar analysis.
@@ -248,29 +180,14 @@ class SessionManager:
         if not session:
             raise SessionNotFoundError.from_session_id(session_id)
 
-        session["is_active"] = False
+        session.is_active = False
         analysis = await llm_service.analyze_grammar(
-            session["history"],
-            session["settings"].primary_language,
-            session["settings"].target_language,
-        )
-
-        # Save session to history for persistence
-        history_service.save_session(
-            session_id=session_id,
-            settings_data={
-                "primary_language": session["settings"].primary_language,
-                "target_language": session["settings"].target_language,
-                "proficiency_level": session["settings"].proficiency_level,
-            },
-            history=session["history"],
-            summary=analysis.summary,
-            feedback=[f.model_dump() for f in analysis.feedback],
+            session.history,
+            session.settings.primary_language,
+            session.settings.target_language,
         )
 
-        # 2. Perform cleanup of audio files
-        cleanup_session_files(session_id)
-
+        await conversation.archive(session, analysis)
         return analysis
 
     async def stop_session(self, session_id: str) -> TurnResponse:
@@ -290,31 +207,13 @@ class SessionManager:
         if not session:
             raise SessionNotFoundError.from_session_id(session_id)
 
-        if not session["is_active"]:
+        if not session.is_active:
             raise SessionError(message="Cannot stop an inactive session")
 
-        # Generate wrap-up message
-        wrap_up_prompt = (
-            "The user has decided to stop the session. Please provide a brief, "
-            "polite wrap-up message in the target language."
-        )
-        session["history"].append({"role": "system", "content": wrap_up_prompt})
-
-        ai_text = await llm_service.get_response(
-            session["history"],
-            session["settings"].target_language,
-            session["settings"].proficiency_level,
-        )
-
-        # Synthesize
-        ai_audio_url = await tts_service.synthesize(
-            ai_text,
-            target_language=session["settings"].target_language,
-            session_id=session_id,
-        )
-
-        session["history"].append({"role": "assistant", "content": ai_text})
-        session["is_active"] = False
+        with conversation.turn_in_progress(session):
+            ai_text, ai_audio_url = await conversation.wrap_up(session)
+        session.history.append({"role": "assistant", "content": ai_text})
+        session.is_active = False
 
         return TurnResponse(
             user_text="",
@@ -337,38 +236,28 @@ class SessionManager:
         if not session:
             return []
 
-        return [Turn(role=h["role"], text=h["content"]) for h in session["history"]]
+        # History entries are built by this module, so validation is skipped
+        return [
+            Turn.model_construct(role=role, text=content)
+            for role, content in map(_ROLE_AND_CONTENT, session.history)
+        ]
+
+    async def wait_for_next_expiry(self) -> None:
+        """Sleep until the earliest expiry is due or a first session is scheduled."""
+        await self._expiries.wait()
 
-    def cleanup_expired_sessions(self, max_age_seconds: int = 3600) -> int:
-        """Remove expired sessions and clean up their files.
+    async def expire_due_sessions(
+        self, max_age_seconds: int = SESSION_MAX_AGE_SECONDS
+    ) -> int:
+        """Remove sessions whose scheduled expiry has passed.
 
         Args:
-            max_age_seconds: Maximum age of sessions before cleanup (default: 3600).
+            max_age_seconds: Maximum idle time before a session is removed.
 
         Returns:
             Number of sessions removed.
         """
-        now = datetime.now(timezone.utc)
-        expired_ids = []
-
-        for session_id, session in self.sessions.items():
-            last_activity = session.get("last_activity")
-            if not last_activity:
-                # Fallback for sessions created before this change in long-running
-                # processes.
-                expired_ids.append(session_id)
-                continue
-
-            delta = (now - last_activity).total_seconds()
-            if delta > max_age_seconds:
-                expired_ids.append(session_id)
-
-        for session_id in expired_ids:
-            # Clean up audio files before removing from memory
-            cleanup_session_files(session_id)
-            del self.sessions[session_id]
-
-        return len(expired_ids)
+        return await self._expiries.expire_due(self.sessions, max_age_seconds)
 
 
 session_manager = SessionManager()
@@ -6,7 +6,6 @@ This module provides the SettingsService class which handles:
 - In-memory caching for performance
 """
 
-import json
 import os
 from typing import Any, Dict, Optional
 
@@ -43,9 +42,8 @@ class SettingsService:
             )
 
         try:
-            with open(self.settings_file, "r") as f:
-                data = json.load(f)
-            return UserSettings(**data)
+            with open(self.settings_file, "rb") as f:
+                return UserSettings.model_validate_json(f.read())
         except Exception as e:
             print(f"Error loading settings: {e}")
             return UserSettings(
@@ -75,8 +73,12 @@ class SettingsService:
         """
         current_settings = self.get_settings()
         # Merge new settings with existing ones
-        updated_data = current_settings.model_dump()
-        updated_data.update(new_settings)
+        current_data = current_settings.model_dump()
+        updated_data = {**current_data, **new_settings}
+
+        # Session starts re-send the same values; skip the rewrite when unchanged
+        if updated_data == current_data:
+            return current_settings
 
         self._settings = UserSettings(**updated_data)
         self._save_settings()
@@ -86,8 +88,8 @@ class SettingsService:
         """Save current settings to JSON file."""
         if self._settings:
             try:
-                with open(self.settings_file, "w") as f:
-                    json.dump(self._settings.model_dump(), f, indent=4)
+                with open(self.settings_file, "w", encoding="utf-8") as f:
+                    f.write(self._settings.model_dump_json(indent=4))
             except Exception as e:
                 print(f"Error saving settings: {e}")
 
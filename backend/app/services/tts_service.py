@@ -14,6 +14,7 @@ from typing import Any, Optional
 
 import soundfile as sf
 
+from app.core.audio import ensure_dir, session_dir
 from app.core.config import settings
 from app.core.exceptions import TTSError
 
@@ -103,9 +104,13 @@ class TTSService:
             return "/static/mock_audio.wav"
 
         try:
-            # Generate unique filename
-            uid = str(uuid.uuid4())
-            filename = f"{session_id}_{uid}.wav" if session_id else f"{uid}.wav"
+            # Generate unique filename inside the session's output directory
+            filename = f"{uuid.uuid4()}.wav"
+            if session_id:
+                output_dir = ensure_dir(
+                    session_dir(settings.AUDIO_OUTPUT_DIR, session_id)
+                )
+                filename = f"{os.path.basename(output_dir)}/{filename}"
             output_path = os.path.join(settings.AUDIO_OUTPUT_DIR, filename)
 
             # Generate audio with specified speed
@@ -5,8 +5,13 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from fastapi.testclient import TestClient
 
-from app.core.exceptions import SessionNotFoundError
-from app.main import app
+from app.core.exceptions import (
+    AppException,
+    ASRError,
+    SessionError,
+    SessionNotFoundError,
+)
+from app.main import app, app_exception_handler
 
 client = TestClient(app)
 
@@ -69,6 +74,23 @@ def test_process_turn_not_found(mock_session_manager):
         assert "test-id" in data["message"]
 
 
+def test_process_turn_unknown_session_saves_nothing(mock_session_manager):
+    """Uploads for unknown sessions are rejected before anything is written."""
+    mock_session_manager.get_active_session.side_effect = SessionNotFoundError(
+        "missing"
+    )
+
+    with patch("app.api.v1.endpoints.session.save_upload_file") as mock_save:
+        response = client.post(
+            "/api/v1/session/missing/turn",
+            files={"audio": ("test.wav", b"dummy content", "audio/wav")},
+        )
+
+    assert response.status_code == 404
+    assert response.json()["error_code"] == "SESSION_NOT_FOUND"
+    mock_save.assert_not_called()
+
+
 def test_get_history(mock_history_service):
     """Ensure history list endpoint returns session summaries."""
     mock_history_service.get_all_sessions.return_value = [
@@ -119,3 +141,84 @@ def test_delete_history(mock_history_service):
 
     assert response.status_code == 200
     assert response.json()["message"] == "Session deleted successfully"
+
+
+def test_get_history_gzip(mock_history_service):
+    """Ensure large history responses are gzip-compressed when accepted."""
+    mock_history_service.get_all_sessions.return_value = [
+        {
+            "session_id": str(i),
+            "timestamp": "2024-01-01T00:00:00",
+            "primary_language": "English",
+            "target_language": "Spanish",
+            "proficiency_level": "A1",
+            "turn_count": 5,
+            "summary": "A fairly long summary of the practice session.",
+        }
+        for i in range(50)
+    ]
+
+    response = client.get("/api/v1/history/", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()["total"] == 50
+
+
+def test_app_exception_without_detail(mock_session_manager):
+    """Ensure detail-less application errors keep the structured error body."""
+    mock_session_manager.stop_session = AsyncMock(
+        side_effect=SessionError(message="Cannot stop an inactive session")
+    )
+
+    for _ in range(2):
+        response = client.post("/api/v1/session/test-id/stop")
+
+        assert response.status_code == 400
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {
+            "error_code": "SESSION_ERROR",
+            "message": "Cannot stop an inactive session",
+            "detail": None,
+        }
+
+
+def test_cors_wildcard_is_static():
+    """The default wildcard CORS policy sends '*' without echoing the origin."""
+    response = client.get("/", headers={"Origin": "http://localhost:5173"})
+
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert "access-control-allow-credentials" not in response.headers
+
+
+def test_app_exception_subclasses_have_direct_handlers():
+    """Each concrete AppException subclass maps straight to the shared handler."""
+    for exc_class in (SessionError, ASRError, AppException):
+        assert app.exception_handlers[exc_class] is app_exception_handler
+
+
+def test_unexpected_error_hides_exception_message(mock_session_manager):
+    """Ensure unhandled errors report only the exception type to the client."""
+    mock_session_manager.stop_session = AsyncMock(
+        side_effect=RuntimeError("internal payload")
+    )
+
+    response = TestClient(app, raise_server_exceptions=False).post(
+        "/api/v1/session/test-id/stop"
+    )
+
+    assert response.status_code == 500
+    assert response.json() == {
+        "error_code": "INTERNAL_SERVER_ERROR",
+        "message": "An unexpected error occurred",
+        "detail": "RuntimeError",
+    }
+
+
+def test_read_root():
+    """Ensure the root endpoint returns the cacheable welcome message."""
+    response = client.get("/")
+
+    assert response.status_code == 200
+    assert response.json() == {"message": "Welcome to Speaking Practice App API"}
+    assert response.headers["cache-control"] == "public, max-age=3600"
@@ -99,3 +99,16 @@ def test_get_settings_loads_persisted(mock_settings_service):
     data = response.json()
     assert data["primary_language"] == "Italian"
     assert data["llm_api_key"] == "existing-key"
+
+
+def test_update_settings_skips_write_when_unchanged(mock_settings_service):
+    """Test that re-sending the current settings does not rewrite the file."""
+    current = mock_settings_service.get_settings().model_dump()
+
+    mock_settings_service.update_settings(current)
+
+    assert not os.path.exists(TEST_SETTINGS_FILE)
+
+    mock_settings_service.update_settings({"stop_word": "halt"})
+
+    assert os.path.exists(TEST_SETTINGS_FILE)
@@ -1,5 +1,7 @@
 """Unit tests for ASR service transcription behavior."""
 
+import asyncio
+import wave
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -137,3 +139,83 @@ async def test_transcribe_error(asr_service):
         with pytest.raises(ASRError) as excinfo:
             await asr_service.transcribe("dummy.wav")
         assert "Transcription failed" in str(excinfo.value)
+
+
+@pytest.mark.asyncio
+async def test_model_loaded_once_on_first_transcription(asr_service):
+    """The model is loaded lazily, once, even for concurrent first calls."""
+    mock_model = MagicMock()
+    mock_model.transcribe.return_value = MagicMock(text="hello")
+
+    def fake_load():
+        asr_service.model = mock_model
+
+    with (
+        patch("sys.platform", "darwin"),
+        patch.object(asr_service, "load_model", side_effect=fake_load) as mock_load,
+    ):
+        results = await asyncio.gather(
+            asr_service.transcribe("a.wav"), asr_service.transcribe("b.wav")
+        )
+
+    mock_load.assert_called_once()
+    assert results == ["hello", "hello"]
+
+
+@pytest.mark.asyncio
+async def test_failed_model_load_raises_asr_error_once(asr_service):
+    """A failed load surfaces as ASRError and is not retried on later turns."""
+    with patch.object(
+        asr_service, "load_model", side_effect=OSError("download failed")
+    ) as mock_load:
+        with pytest.raises(ASRError) as excinfo:
+            await asr_service.transcribe("a.wav")
+        result = await asr_service.transcribe("b.wav")
+
+    assert "ASR model failed to load" in str(excinfo.value)
+    assert "mock transcription" in result
+    mock_load.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_identical_audio_served_from_cache(asr_service, tmp_path):
+    """Re-submitting the same audio bytes reuses the earlier transcription."""
+    first = tmp_path / "first.wav"
+    second = tmp_path / "second.wav"
+    first.write_bytes(b"same audio")
+    second.write_bytes(b"same audio")
+
+    with patch("sys.platform", "darwin"):
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = MagicMock(text="Hello world")
+        asr_service.model = mock_model
+
+        assert await asr_service.transcribe(str(first)) == "Hello world"
+        assert await asr_service.transcribe(str(second)) == "Hello world"
+
+    mock_model.transcribe.assert_called_once_with(str(first))
+
+
+@pytest.mark.asyncio
+async def test_transcribe_win_passes_decoded_samples(asr_service, tmp_path):
+    """A 16kHz upload is decoded once and handed to NeMo as float32 samples."""
+    audio_path = tmp_path / "turn.wav"
+    with wave.open(str(audio_path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(b"\x00\x00" * 160)
+
+    with patch("sys.platform", "linux"):
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = ["Hello samples"]
+        asr_service.model = mock_model
+
+        result = await asr_service.transcribe(str(audio_path))
+
+    assert result == "Hello samples"
+    call = mock_model.transcribe.call_args
+    (samples,) = call.args[0]
+    assert call.kwargs == {"batch_size": 1}
+    assert samples.dtype == "float32"
+    assert samples.shape == (160,)
@@ -0,0 +1,147 @@
+"""Unit tests for audio upload conversion, per-session storage, and cleanup."""
+
+import io
+import os
+import subprocess
+import wave
+from unittest.mock import patch
+
+import pytest
+
+from app.core import audio
+from app.core.config import settings
+
+
+@pytest.fixture
+def audio_dirs(tmp_path, monkeypatch):
+    """Point upload/output directories at a temporary location."""
+    upload_dir = tmp_path / "uploads"
+    output_dir = tmp_path / "outputs"
+    upload_dir.mkdir()
+    output_dir.mkdir()
+    monkeypatch.setattr(settings, "AUDIO_UPLOAD_DIR", str(upload_dir))
+    monkeypatch.setattr(settings, "AUDIO_OUTPUT_DIR", str(output_dir))
+    return upload_dir, output_dir
+
+
+def _wav_bytes(framerate: int, channels: int = 1) -> io.BytesIO:
+    """Build a short silent 16-bit PCM WAV in memory."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(framerate)
+        wav.writeframes(b"\x00\x00" * channels * 160)
+    buffer.seek(0)
+    return buffer
+
+
+def test_save_upload_file_skips_conversion_for_asr_ready_wav(tmp_path):
+    """A 16kHz mono 16-bit WAV is moved into place without running ffmpeg."""
+    destination = str(tmp_path / "s1" / "turn.wav")
+
+    with patch("app.core.audio.subprocess.run") as mock_run:
+        saved = audio.save_upload_file(_wav_bytes(16000), destination)
+
+    mock_run.assert_not_called()
+    assert saved == destination
+    with wave.open(saved, "rb") as wav:
+        assert wav.getframerate() == 16000
+    assert os.listdir(tmp_path / "s1") == ["turn.wav"]
+
+
+def test_save_upload_file_converts_other_wav(tmp_path):
+    """Convert WAVs in another format with ffmpeg."""
+    destination = str(tmp_path / "s1" / "turn.wav")
+
+    with patch("app.core.audio.subprocess.run") as mock_run:
+        saved = audio.save_upload_file(_wav_bytes(44100, channels=2), destination)
+
+    mock_run.assert_called_once()
+    assert mock_run.call_args.args[0][-1] == saved
+
+
+def _ffmpeg_fails_after_partial_write(cmd, **kwargs):
+    """Write a truncated output file, then fail like a crashed ffmpeg."""
+    with open(cmd[-1], "wb") as f:
+        f.write(b"RIFF")
+    raise subprocess.CalledProcessError(1, cmd)
+
+
+@pytest.mark.parametrize(
+    "run_side_effect", [FileNotFoundError, _ffmpeg_fails_after_partial_write]
+)
+def test_save_upload_file_falls_back_to_raw_upload(tmp_path, run_side_effect):
+    """When ffmpeg fails the spooled upload is kept as-is at the destination."""
+    destination = str(tmp_path / "s1" / "turn.webm")
+
+    with patch("app.core.audio.subprocess.run", side_effect=run_side_effect):
+        saved = audio.save_upload_file(io.BytesIO(b"raw audio"), destination)
+
+    assert saved == destination
+    with open(saved, "rb") as f:
+        assert f.read() == b"raw audio"
+    assert os.listdir(tmp_path / "s1") == ["turn.webm"]
+
+
+def test_session_dir_sanitizes_session_id(tmp_path):
+    """Session directories stay inside the base directory."""
+    path = audio.session_dir(str(tmp_path), "../../etc")
+    assert os.path.dirname(path) == str(tmp_path)
+    assert os.path.basename(path) == "etc"
+
+
+@pytest.mark.parametrize("session_id", ["", ".", ".."])
+def test_session_dir_rejects_unsafe_session_id(tmp_path, session_id):
+    """Session IDs that would resolve to the base or parent directory fail."""
+    with pytest.raises(ValueError):
+        audio.session_dir(str(tmp_path), session_id)
+
+
+def test_cleanup_session_files_removes_only_that_session(audio_dirs):
+    """Cleanup removes the session's directories and leaves others intact."""
+    upload_dir, output_dir = audio_dirs
+    for base in (upload_dir, output_dir):
+        for session_id in ("s1", "s2"):
+            path = audio.ensure_dir(audio.session_dir(str(base), session_id))
+            with open(os.path.join(path, "turn.wav"), "wb") as f:
+                f.write(b"data")
+
+    audio.cleanup_session_files("s1")
+
+    assert not (upload_dir / "s1").exists()
+    assert not (output_dir / "s1").exists()
+    assert (upload_dir / "s2" / "turn.wav").exists()
+    assert (output_dir / "s2" / "turn.wav").exists()
+
+
+def test_cleanup_session_files_allows_directory_reuse(audio_dirs):
+    """A session directory is recreated after it has been cleaned up."""
+    upload_dir, _ = audio_dirs
+    path = audio.ensure_dir(audio.session_dir(str(upload_dir), "s1"))
+
+    audio.cleanup_session_files("s1")
+    audio.ensure_dir(path)
+
+    assert os.path.isdir(path)
+
+
+def test_cleanup_orphaned_files_removes_stale_entries(audio_dirs):
+    """Stale files and session directories are removed, fresh ones are kept."""
+    upload_dir, output_dir = audio_dirs
+    stale_dir = upload_dir / "old-session"
+    stale_dir.mkdir()
+    (stale_dir / "turn.wav").write_bytes(b"data")
+    stale_file = output_dir / "old.wav"
+    stale_file.write_bytes(b"data")
+    fresh_file = output_dir / "new.wav"
+    fresh_file.write_bytes(b"data")
+    os.utime(stale_dir, (0, 0))
+    os.utime(stale_file, (0, 0))
+
+    deleted = audio.cleanup_orphaned_files(max_age_hours=2)
+
+    assert deleted == 2
+    assert not stale_dir.exists()
+    assert not stale_file.exists()
+    assert fresh_file.exists()
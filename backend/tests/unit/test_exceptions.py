@@ -0,0 +1,73 @@
+"""Unit tests for custom application exceptions."""
+
+import copy
+import pickle
+
+import pytest
+
+from app.core.exceptions import (
+    AppException,
+    ASRError,
+    SessionError,
+    SessionNotFoundError,
+)
+
+
+def test_preset_exception_defaults():
+    """Preset exceptions carry their status code, error code, and message."""
+    exc = ASRError()
+    assert exc.status_code == 500
+    assert exc.error_code == "ASR_ERROR"
+    assert exc.message == "Speech recognition failed"
+    assert exc.detail is None
+
+
+def test_session_not_found_formats_message():
+    """Build the not-found message and detail from the session ID."""
+    exc = SessionNotFoundError("abc")
+    assert exc.status_code == 404
+    assert exc.message == "Session abc not found"
+    assert exc.detail == {"session_id": "abc"}
+    assert exc.session_id == "abc"
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        AppException("Something broke", {"a": 1}),
+        SessionError(message="Inactive", detail=[1, 2]),
+        SessionNotFoundError("abc"),
+    ],
+)
+def test_exceptions_pickle_round_trip(exc):
+    """Exceptions survive pickling with all fields intact."""
+    restored = pickle.loads(pickle.dumps(exc))
+    assert type(restored) is type(exc)
+    assert restored.status_code == exc.status_code
+    assert restored.error_code == exc.error_code
+    assert restored.message == exc.message
+    assert restored.detail == exc.detail
+
+
+def test_exceptions_copy_and_reduce():
+    """copy.copy and an explicit __reduce__ use the same reconstruction tuple."""
+    exc = SessionNotFoundError("abc")
+    assert exc.__reduce__() == exc.__reduce_ex__(4)
+
+    copied = copy.copy(exc)
+    assert type(copied) is SessionNotFoundError
+    assert copied.detail == {"session_id": "abc"}
+
+
+def test_status_and_error_codes_are_class_data():
+    """Status and error codes are shared class attributes, not instance state."""
+    assert SessionError.status_code == 400
+    assert SessionError.error_code == "SESSION_ERROR"
+    assert AppException.status_code == 500
+
+
+def test_exception_str_is_message():
+    """The exception's string form and args contain only the message."""
+    exc = SessionError(message="Inactive", detail={"x": 1})
+    assert exc.args == ("Inactive",)
+    assert str(exc) == "Inactive"
@@ -0,0 +1,34 @@
+"""Unit tests for the greeting cache."""
+
+from app.core.greeting_cache import GREETING_VARIANTS, GreetingCache
+
+KEY = ("Spanish", "A1", "Food", "gpt-4o", "https://api.openai.com/v1")
+
+
+def test_get_returns_none_until_all_variants_exist():
+    """Greetings are only reused once GREETING_VARIANTS have been generated."""
+    cache = GreetingCache()
+    for i in range(GREETING_VARIANTS - 1):
+        cache.add(KEY, f"Hola {i}")
+        assert cache.get(KEY) is None
+
+    cache.add(KEY, "Hola final")
+    assert cache.get(KEY) is not None
+
+
+def test_add_caps_variants_per_key():
+    """Extra greetings from concurrent misses are not stored."""
+    cache = GreetingCache()
+    for i in range(GREETING_VARIANTS + 3):
+        cache.add(KEY, f"Hola {i}")
+
+    assert cache._entries[KEY] == [f"Hola {i}" for i in range(GREETING_VARIANTS)]
+
+
+def test_keys_differ_by_base_url():
+    """Providers sharing a model name do not share greetings."""
+    cache = GreetingCache()
+    for i in range(GREETING_VARIANTS):
+        cache.add(KEY, f"Hola {i}")
+
+    assert cache.get(KEY[:4] + ("http://localhost:11434/v1",)) is None
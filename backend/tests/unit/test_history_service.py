@@ -3,6 +3,7 @@
 import os
 
 import pytest
+from pydantic import ValidationError
 
 from app.services.history_service import HistoryService
 
@@ -106,3 +107,86 @@ def test_delete_all_sessions(history_service):
     # Test deleting when empty
     deleted_count_empty = history_service.delete_all_sessions()
     assert deleted_count_empty == 0
+
+
+def test_get_session_by_id_cached_until_deleted(history_service):
+    """Test repeat detail lookups are cached and deletion invalidates them."""
+    history_service.save_session("session1", {}, [], "Summary", [])
+
+    first = history_service.get_session_by_id("session1")
+    assert history_service.get_session_by_id("session1") is first
+
+    history_service.delete_session("session1")
+    assert history_service.get_session_by_id("session1") is None
+
+
+def test_get_session_by_id_cache_invalidated_on_save(history_service):
+    """Test saving a session again replaces its record and cached detail."""
+    history_service.save_session("session1", {}, [], "First", [])
+    assert history_service.get_session_by_id("session1").summary == "First"
+
+    history_service.save_session("session1", {}, [], "Second", [])
+
+    assert "session1" not in history_service._detail_cache
+    assert history_service.get_session_by_id("session1").summary == "Second"
+    assert len(history_service.get_all_sessions()) == 1
+
+
+def test_cached_session_detail_is_immutable(history_service):
+    """Test cached details can't be mutated by one caller for all others."""
+    history_service.save_session("session1", {}, [], "Summary", [])
+    detail = history_service.get_session_by_id("session1")
+
+    with pytest.raises(ValidationError):
+        detail.summary = "Changed"
+
+
+def test_save_history_replaces_file_atomically(history_service):
+    """Test saves go through a temp file that is renamed into place."""
+    history_service.save_session("session1", {}, [], "Résumé", [])
+
+    assert os.path.exists(history_service.history_file)
+    assert not os.path.exists(history_service.history_file + ".tmp")
+    with open(history_service.history_file, encoding="utf-8") as f:
+        assert "Résumé" in f.read()
+
+
+def test_history_reloaded_from_disk(history_service):
+    """Test a new service instance loads previously saved sessions."""
+    history_service.save_session("session1", {}, [], "Summary", [])
+
+    reloaded = HistoryService()
+    reloaded.history_file = history_service.history_file
+
+    sessions = reloaded.get_all_sessions()
+    assert [s.session_id for s in sessions] == ["session1"]
+
+
+def test_duplicate_records_on_disk_resolve_to_first(history_service):
+    """Test lookups in older files with repeated IDs return the first record."""
+    history_service.save_session("session1", {}, [], "First", [])
+    history_service.save_session("session2", {}, [], "Second", [])
+    history_service._history[1]["session_id"] = "session1"
+    history_service._save_history()
+
+    reloaded = HistoryService()
+    reloaded.history_file = history_service.history_file
+
+    assert reloaded.get_session_by_id("session1").summary == "First"
+
+
+def test_list_view_rebuilt_only_after_changes(history_service):
+    """Test the sorted list view is reused until a save or delete."""
+    history_service.save_session("session1", {}, [], "Summary", [])
+    first = history_service.get_all_sessions()
+    assert history_service.get_all_sessions()[0] is first[0]
+
+    history_service.save_session("session2", {}, [], "Summary", [])
+    assert [s.session_id for s in history_service.get_all_sessions()] == [
+        "session2",
+        "session1",
+    ]
+
+    assert history_service.delete_session("session2") is True
+    assert history_service.delete_session("session2") is False
+    assert [s.session_id for s in history_service.get_all_sessions()] == ["session1"]
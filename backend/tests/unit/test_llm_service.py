@@ -1,10 +1,12 @@
 """Unit tests for LLM service behavior."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.core.exceptions import LLMError
+from app.core.greeting_cache import GREETING_VARIANTS
 from app.services.llm_service import LLMService
 
 
@@ -52,7 +54,7 @@ async def test_generate_greeting(llm_service, mock_openai, mock_settings):
     mock_openai.chat.completions.create.assert_called_once()
     args, kwargs = mock_openai.chat.completions.create.call_args
     assert kwargs["model"] == "test-model"
-    assert "Spanish" in kwargs["messages"][0]["content"]
+    assert "Spanish" in kwargs["messages"][1]["content"]
 
 
 @pytest.mark.asyncio
@@ -70,6 +72,27 @@ async def test_get_response(llm_service, mock_openai, mock_settings):
     mock_openai.chat.completions.create.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_system_prompt_prefix_is_shared(llm_service, mock_openai, mock_settings):
+    """Sessions in different languages send the same leading system message."""
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock()]
+    mock_response.choices[0].message.content = "Hi"
+    mock_openai.chat.completions.create.return_value = mock_response
+
+    history = [{"role": "user", "content": "Hello"}]
+    await llm_service.get_response(history, "English", "B1")
+    await llm_service.get_response(history, "Spanish", "A2")
+
+    first, second = (
+        call.kwargs["messages"]
+        for call in mock_openai.chat.completions.create.call_args_list
+    )
+    assert first[0] == second[0]
+    assert "Spanish" in second[1]["content"]
+    assert second[2] == {"role": "user", "content": "Hello"}
+
+
 @pytest.mark.asyncio
 async def test_analyze_grammar(llm_service, mock_openai, mock_settings):
     """Analyze grammar returns parsed analysis output."""
@@ -86,6 +109,49 @@ async def test_analyze_grammar(llm_service, mock_openai, mock_settings):
     mock_openai.chat.completions.create.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_analyze_grammar_sends_compact_conversation(
+    llm_service, mock_openai, mock_settings
+):
+    """The conversation is sent with short speaker tags and no system notes."""
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock()]
+    mock_response.choices[0].message.content = '{"summary": "Good", "feedback": []}'
+    mock_openai.chat.completions.create.return_value = mock_response
+
+    history = [
+        {"role": "assistant", "content": "Hola"},
+        {"role": "user", "content": "Yo tiene un gato."},
+        {"role": "system", "content": "This is the final turn."},
+    ]
+    await llm_service.analyze_grammar(history, "English", "Spanish")
+
+    messages = mock_openai.chat.completions.create.call_args.kwargs["messages"]
+    assert "English" in messages[1]["content"]
+    assert messages[2]["content"] == "A: Hola\nU: Yo tiene un gato."
+
+
+@pytest.mark.asyncio
+async def test_generate_greeting_reuses_cached_variants(
+    llm_service, mock_openai, mock_settings
+):
+    """After enough variants for a topic, greetings come from the cache."""
+    replies = [f"Hola {i}" for i in range(GREETING_VARIANTS + 2)]
+    mock_openai.chat.completions.create.side_effect = [
+        MagicMock(choices=[MagicMock(message=MagicMock(content=reply))])
+        for reply in replies
+    ]
+
+    with patch("app.services.llm_service.get_topic_for_level", return_value="Food"):
+        greetings = [
+            await llm_service.generate_greeting("Spanish", "A1")
+            for _ in range(GREETING_VARIANTS + 2)
+        ]
+
+    assert mock_openai.chat.completions.create.call_count == GREETING_VARIANTS
+    assert set(greetings[GREETING_VARIANTS:]) <= set(replies[:GREETING_VARIANTS])
+
+
 @pytest.mark.asyncio
 async def test_generate_greeting_error(llm_service, mock_openai, mock_settings):
     """Generate greeting should raise LLMError on failures."""
@@ -102,3 +168,105 @@ def test_clean_text(llm_service):
     dirty_text = "**Hello** *world* [link](url) `code` \n- list item\n1. First"
     expected = "Hello world link list item First"
     assert llm_service._clean_text(dirty_text) == expected
+
+
+def test_clean_text_nested_markdown(llm_service):
+    """Emphasis inside links and list items is stripped in the same pass."""
+    dirty_text = "* [**Bold** link](url)\n2. __Item__ with a_b"
+    assert llm_service._clean_text(dirty_text) == "Bold link Item with ab"
+
+
+@pytest.mark.asyncio
+async def test_client_reused_until_settings_change(llm_service, mock_settings):
+    """The API client is cached and rebuilt only when key or URL changes."""
+    with patch("app.services.llm_service.AsyncOpenAI") as mock_client_cls:
+        mock_client_cls.side_effect = lambda **kwargs: MagicMock(close=AsyncMock())
+
+        first, _ = llm_service._get_client()
+        second, _ = llm_service._get_client()
+        assert first is second
+
+        mock_settings.get_settings.return_value.llm_base_url = "https://other.api"
+        third, model = llm_service._get_client()
+
+    assert third is not first
+    assert model == "test-model"
+    assert mock_client_cls.call_count == 2
+
+
+def test_warmup_builds_client(llm_service, mock_settings):
+    """Warmup loads the settings and builds the client used by requests."""
+    with patch("app.services.llm_service.AsyncOpenAI") as mock_client_cls:
+        llm_service.warmup()
+        client, _ = llm_service._get_client()
+
+    mock_settings.get_settings.assert_called()
+    mock_client_cls.assert_called_once()
+    assert client is mock_client_cls.return_value
+
+
+def test_warmup_without_api_key_skips_client(llm_service, mock_settings):
+    """Warmup still loads settings but builds no client when no key is set."""
+    mock_settings.get_settings.return_value.llm_api_key = None
+    with patch("app.services.llm_service.AsyncOpenAI") as mock_client_cls:
+        llm_service.warmup()
+
+    mock_settings.get_settings.assert_called_once()
+    mock_client_cls.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_cached_client(llm_service, mock_settings):
+    """Closing the service closes the cached client and drops it."""
+    with patch("app.services.llm_service.AsyncOpenAI") as mock_client_cls:
+        mock_client_cls.return_value.close = AsyncMock()
+        client, _ = llm_service._get_client()
+
+        await llm_service.aclose()
+        await llm_service.aclose()
+
+    client.close.assert_awaited_once()
+    assert llm_service._client is None
+
+
+@pytest.mark.asyncio
+async def test_client_replaced_by_settings_change_is_closed(llm_service, mock_settings):
+    """A client replaced after a settings change is closed before shutdown."""
+    with patch("app.services.llm_service.AsyncOpenAI") as mock_client_cls:
+        mock_client_cls.side_effect = lambda **kwargs: MagicMock(close=AsyncMock())
+        old, _ = llm_service._get_client()
+        mock_settings.get_settings.return_value.llm_api_key = "new-key"
+        new, _ = llm_service._get_client()
+        await asyncio.sleep(0)
+
+        old.close.assert_awaited_once()
+        new.close.assert_not_awaited()
+
+        await llm_service.aclose()
+
+    new.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "base_url, expected",
+    [
+        ("https://api.openai.com/v1", {"prompt_cache_key": "session-1"}),
+        ("http://localhost:11434/v1", None),
+    ],
+)
+async def test_get_response_prompt_cache_key(
+    llm_service, mock_openai, mock_settings, base_url, expected
+):
+    """Only the OpenAI API is sent the session's prompt cache key."""
+    mock_settings.get_settings.return_value.llm_base_url = base_url
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock()]
+    mock_response.choices[0].message.content = "Hi"
+    mock_openai.chat.completions.create.return_value = mock_response
+
+    history = [{"role": "user", "content": "Hello"}]
+    await llm_service.get_response(history, "English", "B1", session_id="session-1")
+
+    _, kwargs = mock_openai.chat.completions.create.call_args
+    assert kwargs["extra_body"] == expected
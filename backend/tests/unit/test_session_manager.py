@@ -1,12 +1,13 @@
 """Unit tests for session manager behavior."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.core.exceptions import SessionError, SessionNotFoundError
-from app.schemas.session import SessionCreate
-from app.services.session_manager import SessionManager
+from app.schemas.session import SessionCreate, Turn
+from app.services.session_manager import ActiveSession, SessionManager
 
 # Mock data
 MOCK_SESSION_ID = "test-session-id"
@@ -19,7 +20,10 @@ MOCK_AUDIO_URL = "http://localhost:8000/static/audio.wav"
 @pytest.fixture
 def mock_llm_service():
     """Mock LLM service methods used by session manager."""
-    with patch("app.services.session_manager.llm_service") as mock:
+    with (
+        patch("app.services.session_manager.llm_service") as mock,
+        patch("app.services.conversation.llm_service", mock),
+    ):
         mock.generate_greeting = AsyncMock(return_value="Hola, amigo")
         mock.get_response = AsyncMock(return_value=MOCK_AI_TEXT)
         mock.analyze_grammar = AsyncMock(
@@ -39,7 +43,7 @@ def mock_asr_service():
 @pytest.fixture
 def mock_tts_service():
     """Mock TTS service synthesize behavior."""
-    with patch("app.services.session_manager.tts_service") as mock:
+    with patch("app.services.conversation.tts_service") as mock:
         mock.synthesize = AsyncMock(return_value=MOCK_AUDIO_URL)
         yield mock
 
@@ -47,7 +51,7 @@ def mock_tts_service():
 @pytest.fixture
 def mock_history_service():
     """Mock history service persistence."""
-    with patch("app.services.session_manager.history_service") as mock:
+    with patch("app.services.conversation.history_service") as mock:
         mock.save_session = MagicMock()
         yield mock
 
@@ -55,7 +59,10 @@ def mock_history_service():
 @pytest.fixture
 def mock_cleanup_session_files():
     """Mock cleanup helper for session files."""
-    with patch("app.services.session_manager.cleanup_session_files") as mock:
+    with (
+        patch("app.services.conversation.cleanup_session_files") as mock,
+        patch("app.core.expiry_queue.cleanup_session_files", mock),
+    ):
         yield mock
 
 
@@ -97,6 +104,24 @@ async def test_create_session(session_manager, mock_llm_service, mock_tts_servic
         "Hola, amigo", target_language="Spanish", session_id=response.session_id
     )
 
+    session = session_manager.sessions[response.session_id]
+    assert isinstance(session, ActiveSession)
+    assert not hasattr(session, "__dict__")
+
+
+@pytest.mark.asyncio
+async def test_get_session_history(session_manager):
+    """Session history is returned as turns; unknown sessions have none."""
+    settings = SessionCreate(
+        primary_language="English", target_language="Spanish", proficiency_level="A1"
+    )
+    response = await session_manager.create_session(settings)
+
+    turns = session_manager.get_session_history(response.session_id)
+
+    assert turns == [Turn(role="assistant", text="Hola, amigo")]
+    assert session_manager.get_session_history("missing") == []
+
 
 @pytest.mark.asyncio
 async def test_process_turn_normal(
@@ -200,13 +225,13 @@ async def test_end_session(
 
     assert analysis is not None
     mock_llm_service.analyze_grammar.assert_called_once_with(
-        session_manager.sessions[session_id]["history"], "English", "Spanish"
+        session_manager.sessions[session_id].history, "English", "Spanish"
     )
     mock_history_service.save_session.assert_called_once()
     mock_cleanup_session_files.assert_called_once_with(session_id)
 
     # Verify session is inactive
-    assert session_manager.sessions[session_id]["is_active"] is False
+    assert session_manager.sessions[session_id].is_active is False
 
 
 @pytest.mark.asyncio
@@ -222,7 +247,7 @@ async def test_process_turn_max_turns(
     session_id = session_response.session_id
 
     # Artificially set turn count to 14
-    session_manager.sessions[session_id]["turn_count"] = 14
+    session_manager.sessions[session_id].turn_count = 14
 
     # 15th turn
     response = await session_manager.process_turn(session_id, MOCK_AUDIO_PATH)
@@ -237,8 +262,10 @@ async def test_process_turn_max_turns(
 
 
 @pytest.mark.asyncio
-async def test_cleanup_expired_sessions(session_manager, mock_cleanup_session_files):
-    """Cleanup should remove expired sessions and call cleanup helper."""
+async def test_expire_due_sessions_removes_idle_sessions(
+    session_manager, mock_cleanup_session_files
+):
+    """Expiry should remove idle sessions and call the cleanup helper."""
     from datetime import datetime, timedelta, timezone
 
     # Create 3 sessions
@@ -259,19 +286,20 @@ async def test_cleanup_expired_sessions(session_manager, mock_cleanup_session_fi
     )
 
     # Set s1 to be very old (2 hours)
-    session_manager.sessions[s1.session_id]["last_activity"] = datetime.now(
+    session_manager.sessions[s1.session_id].last_activity = datetime.now(
         timezone.utc
     ) - timedelta(hours=2)
 
     # Set s2 to be slightly old (30 mins)
-    session_manager.sessions[s2.session_id]["last_activity"] = datetime.now(
+    session_manager.sessions[s2.session_id].last_activity = datetime.now(
         timezone.utc
     ) - timedelta(minutes=30)
 
     # s3 is brand new
 
-    # Cleanup sessions older than 1 hour
-    removed = session_manager.cleanup_expired_sessions(max_age_seconds=3600)
+    # Make every scheduled expiry due; only sessions idle for over an hour go
+    session_manager._expiries._heap = [(0.0, s.session_id) for s in (s1, s2, s3)]
+    removed = await session_manager.expire_due_sessions(max_age_seconds=3600)
 
     assert removed == 1
     assert s1.session_id not in session_manager.sessions
@@ -280,3 +308,97 @@ async def test_cleanup_expired_sessions(session_manager, mock_cleanup_session_fi
 
     # Verify cleanup was called for s1
     mock_cleanup_session_files.assert_called_with(s1.session_id)
+
+
+@pytest.mark.asyncio
+async def test_expire_due_sessions_uses_schedule(
+    session_manager, mock_cleanup_session_files
+):
+    """Only due sessions are expired; recently active ones are rescheduled."""
+    from datetime import datetime, timedelta, timezone
+
+    settings = SessionCreate(
+        primary_language="en", target_language="es", proficiency_level="A1"
+    )
+    waiter = asyncio.create_task(session_manager.wait_for_next_expiry())
+    await asyncio.sleep(0)
+    s1 = await session_manager.create_session(settings)
+    s2 = await session_manager.create_session(settings)
+    # Scheduling the first session wakes an idle cleanup wait
+    await asyncio.wait_for(waiter, timeout=1)
+    assert session_manager._expiries.seconds_until_next() > 3500
+
+    # Nothing is due yet
+    assert await session_manager.expire_due_sessions() == 0
+
+    # Make both entries due, but keep s2 active
+    session_manager._expiries._heap = [(0.0, s1.session_id), (0.0, s2.session_id)]
+    session_manager.sessions[s1.session_id].last_activity = datetime.now(
+        timezone.utc
+    ) - timedelta(hours=2)
+
+    assert await session_manager.expire_due_sessions() == 1
+    assert s1.session_id not in session_manager.sessions
+    assert s2.session_id in session_manager.sessions
+    mock_cleanup_session_files.assert_called_once_with(s1.session_id)
+    assert session_manager._expiries.seconds_until_next() > 3500
+
+
+@pytest.mark.asyncio
+async def test_sessions_capped_with_lru_eviction(
+    session_manager, mock_cleanup_session_files, monkeypatch
+):
+    """Creating a session past MAX_SESSIONS evicts the least recently used one."""
+    from app.core.config import settings as app_settings
+
+    monkeypatch.setattr(app_settings, "MAX_SESSIONS", 2)
+    settings = SessionCreate(
+        primary_language="en", target_language="es", proficiency_level="A1"
+    )
+    s1 = await session_manager.create_session(settings)
+    s2 = await session_manager.create_session(settings)
+
+    # A turn on s1 makes s2 the least recently used session
+    await session_manager.process_turn(s1.session_id, "dummy.wav")
+    s3 = await session_manager.create_session(settings)
+
+    assert list(session_manager.sessions) == [s1.session_id, s3.session_id]
+    mock_cleanup_session_files.assert_called_once_with(s2.session_id)
+
+
+@pytest.mark.asyncio
+async def test_eviction_skips_session_with_turn_in_progress(
+    session_manager, mock_asr_service, mock_cleanup_session_files, monkeypatch
+):
+    """A session mid-turn is not evicted even when it is least recently used."""
+    from app.core.config import settings as app_settings
+
+    monkeypatch.setattr(app_settings, "MAX_SESSIONS", 2)
+    settings = SessionCreate(
+        primary_language="en", target_language="es", proficiency_level="A1"
+    )
+    s1 = await session_manager.create_session(settings)
+    s2 = await session_manager.create_session(settings)
+
+    transcribing = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_transcribe(path):
+        transcribing.set()
+        await release.wait()
+        return MOCK_USER_TEXT
+
+    mock_asr_service.transcribe = AsyncMock(side_effect=slow_transcribe)
+    turn = asyncio.create_task(session_manager.process_turn(s2.session_id, "a.wav"))
+    await transcribing.wait()
+    # Make the busy s2 the least recently used session
+    session_manager.sessions.move_to_end(s1.session_id)
+
+    s3 = await session_manager.create_session(settings)
+    release.set()
+    response = await turn
+
+    assert response.ai_text == MOCK_AI_TEXT
+    assert list(session_manager.sessions) == [s2.session_id, s3.session_id]
+    mock_cleanup_session_files.assert_called_once_with(s1.session_id)
+    assert not session_manager.sessions[s2.session_id].in_turn
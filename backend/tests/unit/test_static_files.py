@@ -0,0 +1,46 @@
+"""Unit tests for generated-audio static file serving."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.static_files import AudioStaticFiles
+
+
+def _client(directory: str, prefix=None) -> TestClient:
+    """Build a client for an app serving the directory at /static."""
+    app = FastAPI()
+    app.mount(
+        "/static",
+        AudioStaticFiles(directory=directory, accel_redirect_prefix=prefix),
+    )
+    return TestClient(app)
+
+
+def test_serves_file_contents(tmp_path):
+    """Files are streamed directly when no redirect prefix is configured."""
+    (tmp_path / "s1").mkdir()
+    (tmp_path / "s1" / "a.wav").write_bytes(b"audio" * 1000)
+
+    response = _client(str(tmp_path)).get("/static/s1/a.wav")
+
+    assert response.status_code == 200
+    assert response.content == b"audio" * 1000
+    assert "x-accel-redirect" not in response.headers
+
+
+def test_accel_redirect_hands_off_to_proxy(tmp_path):
+    """With a prefix, the response carries X-Accel-Redirect and no body."""
+    (tmp_path / "s1").mkdir()
+    (tmp_path / "s1" / "a.wav").write_bytes(b"audio")
+
+    response = _client(str(tmp_path), "/_internal/static/").get("/static/s1/a.wav")
+
+    assert response.status_code == 200
+    assert response.headers["x-accel-redirect"] == "/_internal/static/s1/a.wav"
+    assert response.content == b""
+
+
+def test_missing_file_is_404(tmp_path):
+    """Unknown paths still return 404 before any redirect is issued."""
+    response = _client(str(tmp_path), "/_internal").get("/static/missing.wav")
+    assert response.status_code == 404
@@ -47,7 +47,7 @@ async def test_synthesize_success(tts_service, mock_pipeline_class):
         result = await tts_service.synthesize(
             "Hola", target_language="Spanish", session_id=session_id
         )
-        assert result.startswith(f"/static/{session_id}_")
+        assert result.startswith(f"/static/{session_id}/")
         mock_pipeline_class.assert_called_with(
             lang_code="e", repo_id="hexgrad/Kokoro-82M"
         )